@@ -9,6 +9,14 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+USAGE = """usage: main.py [--help] [--version]
+
+Jinkies - Atom feed monitor with audio cues and desktop notifications.
+
+options:
+  -h, --help  show this help message and exit
+  --version   show the version and exit"""
+
 
 def main() -> int:
     """Launch the Jinkies application.
@@ -16,14 +24,26 @@ def main() -> int:
     Returns:
         The application exit code.
     """
-    # Ensure the project root is on sys.path for imports
+    # Ensure the project root is on sys.path for imports.  __file__ is
+    # already absolute for the main script, so no resolve() is needed, and a
+    # duplicate sys.path entry is harmless, so skip the membership scan.
     if getattr(sys, "frozen", False):
         app_dir = Path(sys._MEIPASS)  # noqa: SLF001
     else:
-        app_dir = Path(__file__).resolve().parent
+        app_dir = Path(__file__).parent
+
+    sys.path.insert(0, str(app_dir))
+
+    # Answer informational flags before importing the Qt application stack.
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(USAGE)
+        return 0
+    if "--version" in args:
+        from src import __version__
 
-    if str(app_dir) not in sys.path:
-        sys.path.insert(0, str(app_dir))
+        print(f"Jinkies {__version__}")
+        return 0
 
     from src.app import run
 
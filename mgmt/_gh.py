@@ -0,0 +1,106 @@
+"""Shared GitHub issue fetch helper for the mgmt report scripts."""
+
+import glob
+import json
+import os
+import subprocess
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $states: [IssueState!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: $states) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        state
+        createdAt
+        closedAt
+        labels(first: 100) { pageInfo { hasNextPage } nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+STATES = {
+    "open": {"OPEN"},
+    "closed": {"CLOSED"},
+    "all": {"OPEN", "CLOSED"},
+}
+
+# Cached responses older than this are re-fetched even on the same UTC day.
+CACHE_MAX_AGE_SECS = 3600
+
+
+def fetch_issues(repo, state="all"):
+    """Fetch every issue in *repo*, reusing today's on-disk cache if fresh.
+
+    All issues are fetched (and cached) regardless of *state* so that the
+    PDF and XLSX reports share one GitHub round-trip; the state filter is
+    applied locally.  Each returned dict has the same shape as ``gh issue
+    list --json number,title,labels,state,createdAt,closedAt``.
+
+    Args:
+        repo: Repository in ``owner/name`` form.
+        state: One of ``"open"``, ``"closed"`` or ``"all"``.
+
+    Returns:
+        A flat list of issue dicts.
+    """
+    cache_dir = Path(tempfile.gettempdir())
+    # Caches are per repository; only this repo's stale days are purged.
+    slug = repo.replace("/", "--")
+    cache_path = cache_dir / f"jinkies-{slug}-{datetime.now(UTC).date().isoformat()}-issues.json"
+    for old in cache_dir.glob(f"jinkies-{glob.escape(slug)}-????-??-??-issues.json"):
+        if old != cache_path:
+            old.unlink(missing_ok=True)
+
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_MAX_AGE_SECS:
+        issues = json.loads(cache_path.read_text(encoding="utf-8"))
+    else:
+        issues = _query_issues(repo)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(issues), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+    wanted = STATES[state]
+    return [i for i in issues if i["state"] in wanted]
+
+
+def _query_issues(repo):
+    """Run the paginated GraphQL query for all open and closed issues.
+
+    Args:
+        repo: Repository in ``owner/name`` form.
+
+    Returns:
+        A flat list of issue dicts.
+    """
+    owner, name = repo.split("/", 1)
+    cmd = ["gh", "api", "graphql", "-F", f"owner={owner}", "-F", f"name={name}",
+           "-f", f"query={ISSUES_QUERY}", "-f", "states[]=OPEN", "-f", "states[]=CLOSED"]
+
+    issues = []
+    cursor = None
+    while True:
+        page_cmd = cmd + (["-f", f"cursor={cursor}"] if cursor else [])
+        # json.loads() accepts the raw UTF-8 bytes, so skip decoding to str first.
+        result = subprocess.run(page_cmd, capture_output=True, check=True)
+        page = json.loads(result.stdout)["data"]["repository"]["issues"]
+        del result
+        for node in page["nodes"]:
+            if node["labels"]["pageInfo"]["hasNextPage"]:
+                # Labels aren't paginated; a truncated list would silently
+                # misfile the issue in the reports.
+                msg = f"Issue #{node['number']} has more than 100 labels"
+                raise RuntimeError(msg)
+            node["labels"] = node["labels"]["nodes"]
+            issues.append(node)
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        cursor = page["pageInfo"]["endCursor"]
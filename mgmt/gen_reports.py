@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Generate the PDF and XLSX issue reports in parallel from one GitHub fetch."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import gen_issues_pdf
+import gen_issues_xlsx
+from _gh import fetch_issues
+
+
+def main():
+    # Populate today's cache up front so both workers read it instead of
+    # racing to query GitHub.
+    fetch_issues("SeamusMullan/Jinkies")
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(gen_issues_pdf.main), pool.submit(gen_issues_xlsx.main)]
+        for future in futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    main()
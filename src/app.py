@@ -7,6 +7,8 @@ components: FeedPoller, AudioPlayer, Notifier, and Dashboard.
 from __future__ import annotations
 
 import datetime
+import functools
+import os
 import sys
 from pathlib import Path
 from typing import IO
@@ -16,6 +18,7 @@ if sys.platform == "win32":
 else:
     import fcntl
 
+from PySide6.QtCore import QThreadPool, QTimer
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
     QApplication,
@@ -27,7 +30,16 @@ from PySide6.QtWidgets import (
 )
 
 from src.audio import AudioPlayer, ensure_default_sounds
-from src.config import load_config, load_state, save_config, save_state
+from src.config import (
+    SEEN_LOG_COMPACT_BYTES,
+    append_seen_ids,
+    load_config,
+    load_state,
+    prune_seen_ids,
+    rotate_seen_log,
+    save_config,
+    save_state,
+)
 from src.dashboard import Dashboard
 from src.feed_import import import_local_feed, import_opml
 from src.feed_poller import FeedPoller
@@ -35,6 +47,18 @@ from src.models import Feed, FeedEntry
 from src.notifier import Notifier
 from src.settings_dialog import FeedEditDialog, ImportPreviewDialog, SettingsDialog
 
+# Idle delay before newly seen entry IDs are written, so a burst of new
+# entries produces a single write.
+STATE_SAVE_DELAY_MS = 2000
+
+# Entries arriving within this window (e.g. several feeds finishing in the
+# same poll cycle) share one sound and one notification.
+NOTIFY_COALESCE_MS = 50
+
+# Delay before the first poll once the event loop is running, so the first
+# batch of HTTP requests doesn't compete with the dashboard's first paint.
+POLLER_START_DELAY_MS = 50
+
 
 def _get_icon_path() -> str:
     """Get the path to the application icon, using the platform-appropriate format.
@@ -88,32 +112,58 @@ def _try_lock(config_dir: Path) -> bool:
     lock_path = config_dir / ".lock"
     lock_path.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        fh: IO[bytes] = lock_path.open("wb")
-    except OSError:
-        return False
+    while True:
+        try:
+            fh: IO[bytes] = lock_path.open("wb")
+        except OSError:
+            return False
 
-    try:
-        if sys.platform == "win32":
-            # msvcrt.locking requires at least one byte to exist in the file.
-            # Write a byte and flush before locking so the byte is on disk.
-            fh.write(b" ")
-            fh.flush()
-            fh.seek(0)
-            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
-        else:
-            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-    except OSError:
         try:
-            fh.close()
+            if sys.platform == "win32":
+                # msvcrt.locking requires at least one byte to exist in the file.
+                # Write a byte and flush before locking so the byte is on disk.
+                fh.write(b" ")
+                fh.flush()
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
         except OSError:
-            pass
-        return False
+            try:
+                fh.close()
+            except OSError:
+                pass
+            return False
+
+        if sys.platform == "win32" or _is_current_lock_file(fh, lock_path):
+            break
+        # The file was opened just before a releasing instance unlinked it,
+        # so the lock is on an orphaned inode that a newer instance won't
+        # see.  Drop it and try again with whatever is at lock_path now.
+        fh.close()
 
     _lock_fh = fh  # Keep open; closing would release the lock
     return True
 
 
+def _is_current_lock_file(fh: IO[bytes], lock_path: Path) -> bool:
+    """Check that an open lock handle still refers to the file at *lock_path*.
+
+    Args:
+        fh: The open, locked file handle.
+        lock_path: The path the handle was opened from.
+
+    Returns:
+        True if *lock_path* exists and is the same file as *fh*.
+    """
+    try:
+        current = lock_path.stat()
+    except FileNotFoundError:
+        return False
+    held = os.fstat(fh.fileno())
+    return (held.st_dev, held.st_ino) == (current.st_dev, current.st_ino)
+
+
 def _release_lock(config_dir: Path) -> None:
     """Release the OS-level advisory lock and remove the lock file.
 
@@ -123,6 +173,13 @@ def _release_lock(config_dir: Path) -> None:
     global _lock_fh  # noqa: PLW0603
 
     lock_path = config_dir / ".lock"
+    # On POSIX the file is unlinked while the lock is still held, so once the
+    # lock is free the old file is no longer at lock_path.  An instance that
+    # opened it just before the unlink can still lock it; _try_lock catches
+    # that by comparing inodes and retrying.  Windows can't remove an open
+    # file, so there it is removed after closing.
+    if sys.platform != "win32":
+        lock_path.unlink(missing_ok=True)
     if _lock_fh is not None:
         try:
             if sys.platform == "win32":
@@ -132,7 +189,8 @@ def _release_lock(config_dir: Path) -> None:
         except OSError:
             pass
         _lock_fh = None
-    lock_path.unlink(missing_ok=True)
+    if sys.platform == "win32":
+        lock_path.unlink(missing_ok=True)
 
 
 class JinkiesApp:
@@ -154,25 +212,48 @@ class JinkiesApp:
         self.app.setApplicationName("Jinkies")
         self.app.setQuitOnLastWindowClosed(False)
 
+        # Decode the icon once and share it between the window and the tray.
         icon_path = _get_icon_path()
-        if icon_path:
-            self.app.setWindowIcon(QIcon(icon_path))
+        self._icon = QIcon(icon_path) if icon_path else None
+        if self._icon is not None:
+            self.app.setWindowIcon(self._icon)
 
         # Load config and state
         self.config = load_config()
+        # Poll responses update each feed's ETag/Last-Modified in place; the
+        # config is saved on quit if they changed so the first poll after a
+        # restart can still be a conditional GET.
+        self._saved_feed_validators = self._feed_validators()
         self._state = load_state(max_age_days=self.config.seen_ids_max_age_days)
         # seen_ids in state is now a dict {entry_id: iso_timestamp}
-        seen_ids_dict: dict[str, str] = self._state.get("seen_ids", {})
-        self._seen_ids: set[str] = set(seen_ids_dict.keys())
-        self._seen_ids_timestamps: dict[str, str] = dict(seen_ids_dict)
-
-        # Ensure default sounds exist
-        ensure_default_sounds()
+        # load_state returns a freshly built dict, so it is used as-is rather
+        # than copied; for large histories that copy doubled startup memory.
+        self._seen_ids_timestamps: dict[str, str] = self._state.get("seen_ids", {})
+        self._seen_ids: set[str] = set(self._seen_ids_timestamps)
+        # IDs seen since the last write, appended to the seen-ID log in batches
+        self._unsaved_seen_ids: dict[str, str] = {}
+
+        self._state_save_timer = QTimer()
+        self._state_save_timer.setSingleShot(True)
+        self._state_save_timer.setInterval(STATE_SAVE_DELAY_MS)
+        self._state_save_timer.timeout.connect(self._flush_seen_ids)
+
+        # New entries waiting to be announced by _announce_new_entries
+        self._unannounced_entries: list[FeedEntry] = []
+        self._announce_timer = QTimer()
+        self._announce_timer.setSingleShot(True)
+        self._announce_timer.setInterval(NOTIFY_COALESCE_MS)
+        self._announce_timer.timeout.connect(self._announce_new_entries)
+
+        # State snapshots are written on this single worker thread so the GUI
+        # never waits on disk I/O; one thread keeps the writes in order.
+        self._state_writer = QThreadPool()
+        self._state_writer.setMaxThreadCount(1)
 
         # Set up system tray (guard against environments without a tray)
         self._tray = QSystemTrayIcon()
-        if icon_path:
-            self._tray.setIcon(QIcon(icon_path))
+        if self._icon is not None:
+            self._tray.setIcon(self._icon)
         else:
             self._tray.setIcon(self.app.style().standardIcon(
                 self.app.style().StandardPixmap.SP_ComputerIcon
@@ -204,13 +285,16 @@ class JinkiesApp:
 
         # Set up components
         self.audio = AudioPlayer(self.config.sound_map)
+        # Generate default sounds (first launch only) and load the effects
+        # once the event loop is running, so neither holds up the window
+        # appearing nor the first notification.
+        QTimer.singleShot(0, self._prepare_audio)
         self.notifier = Notifier(
             tray_icon=self._tray,
             style=self.config.notification_style,
         )
 
-        self.dashboard = Dashboard()
-        self.dashboard.max_entries = self.config.max_entries
+        self.dashboard = Dashboard(max_entries=self.config.max_entries)
         self.dashboard.page_size = self.config.page_size
         self.dashboard.update_feeds(self.config.feeds)
         self.dashboard.update_feed_names_mapping(self.config.feeds)
@@ -239,7 +323,12 @@ class JinkiesApp:
         self.poller.poll_complete.connect(self._on_poll_complete)
         self.poller.poll_time_updated.connect(self._on_poll_time_updated)
         self.poller.feed_backoff_changed.connect(self._on_feed_backoff_changed)
-        self.poller.start()
+        QTimer.singleShot(POLLER_START_DELAY_MS, self.poller.start)
+
+    def _prepare_audio(self) -> None:
+        """Ensure the default sounds exist and preload the audio effects."""
+        ensure_default_sounds()
+        self.audio.preload()
 
     def _setup_tray_menu(self) -> None:
         """Create the system tray context menu."""
@@ -282,45 +371,69 @@ class JinkiesApp:
     def _on_new_entries(self, entries: list[FeedEntry]) -> None:
         """Handle new entries found by the poller.
 
+        The dashboard and seen IDs are updated immediately; the sound and
+        notification follow from :meth:`_announce_new_entries`.
+
         Args:
             entries: List of new FeedEntry objects.
         """
+        feed_urls = {e.feed_url for e in entries}
+
         # A successful delivery means the feed is healthy; clear any stored
         # error state so that a future error will notify again.
-        for entry in entries:
-            self._errored_feeds.discard(entry.feed_url)
-            self.dashboard.clear_feed_error(entry.feed_url)
+        for url in feed_urls:
+            self._errored_feeds.discard(url)
+            self.dashboard.clear_feed_error(url)
 
         self.dashboard.add_entries(entries)
 
-        # Honour per-feed custom sound if configured.  All entries in a single
-        # emission come from the same feed, so checking the first entry is
-        # sufficient.
+        # The window is not restarted by later batches, so a steady stream
+        # of entries is still announced every NOTIFY_COALESCE_MS.
+        self._unannounced_entries.extend(entries)
+        if not self._announce_timer.isActive():
+            self._announce_timer.start()
+
+        # Update seen IDs and record when each ID was first seen
+        now_iso = datetime.datetime.now(datetime.UTC).isoformat()
+        entry_ids = [e.entry_id for e in entries]
+        self._seen_ids.update(entry_ids)
+        first_seen = {
+            entry_id: now_iso
+            for entry_id in entry_ids
+            if entry_id not in self._seen_ids_timestamps
+        }
+        self._seen_ids_timestamps.update(first_seen)
+        self._unsaved_seen_ids.update(first_seen)
+        self._schedule_save_state()
+
+    def _announce_new_entries(self) -> None:
+        """Play the new-entry sound and show one notification for pending entries.
+
+        Batches that arrived within :data:`NOTIFY_COALESCE_MS` of each other
+        are announced together.
+        """
+        entries = self._unannounced_entries
+        if not entries:
+            return
+        self._unannounced_entries = []
+        feed_urls = {e.feed_url for e in entries}
+
+        # Honour per-feed custom sound if configured.  Only one sound is
+        # played, so a batch spanning feeds uses the first entry's feed.
         feed_map = {f.url: f for f in self.config.feeds}
-        if entries:
-            feed = feed_map.get(entries[0].feed_url)
-        else:
-            feed = None
+        feed = feed_map.get(entries[0].feed_url)
         sound_file = feed.sound_file if feed else None
         self.audio.play("new_entry", sound_file=sound_file)
 
         count = len(entries)
-        if count == 1:
-            title = entries[0].title
-            body = f"From: {entries[0].feed_url}"
+        title = entries[0].title if count == 1 else f"{count} new entries"
+        if len(feed_urls) == 1:
+            body = f"From: {next(iter(feed_urls))}"
         else:
-            title = f"{count} new entries"
-            body = f"From {len({e.feed_url for e in entries})} feed(s)"
+            body = f"From {len(feed_urls)} feed(s)"
 
         self.notifier.notify("Jinkies!", f"{title}\n{body}")
 
-        # Update seen IDs and record when each ID was first seen
-        now_iso = datetime.datetime.now(datetime.UTC).isoformat()
-        for entry in entries:
-            self._seen_ids.add(entry.entry_id)
-            self._seen_ids_timestamps.setdefault(entry.entry_id, now_iso)
-        self._save_state()
-
     def _on_feed_error(self, url: str, error: str) -> None:
         """Handle a feed polling error.
 
@@ -473,7 +586,11 @@ class JinkiesApp:
             return
         for i in sorted(valid, reverse=True):
             self.config.feeds.pop(i)
-        self._apply_config_changes()
+        # Only the feed list changed, so drop the rows in place rather than
+        # rebuilding every component through _apply_config_changes().
+        save_config(self.config)
+        self.dashboard.remove_feeds(valid)
+        self.poller.update_feeds(self.config.feeds)
 
     def _on_settings(self) -> None:
         """Show the settings dialog."""
@@ -492,39 +609,56 @@ class JinkiesApp:
         self.poller.update_feeds(self.config.feeds)
         self.poller.update_interval(self.config.poll_interval_secs)
         self.audio.sound_map = self.config.sound_map
-        self.notifier = Notifier(
-            tray_icon=self._tray,
-            style=self.config.notification_style,
-        )
+        self.notifier.set_style(self.config.notification_style)
+
+    def _schedule_save_state(self) -> None:
+        """Persist newly seen IDs once no further changes arrive for a short while.
+
+        Each call restarts the idle timer, so bursts of updates are coalesced
+        into a single :meth:`_flush_seen_ids`.
+        """
+        self._state_save_timer.start()
+
+    def _flush_seen_ids(self) -> None:
+        """Append unsaved seen IDs to the log, compacting it when it grows large."""
+        if not self._unsaved_seen_ids:
+            return
+        log_size = append_seen_ids(self._unsaved_seen_ids)
+        self._unsaved_seen_ids = {}
+        if log_size > SEEN_LOG_COMPACT_BYTES:
+            self._save_state()
 
     def _save_state(self) -> None:
-        """Persist the current state to disk."""
+        """Snapshot the state and write it on the state writer thread.
+
+        The snapshot folds in the seen-ID log, which is removed once the
+        write completes.
+        """
+        self._state_save_timer.stop()
+        self._unsaved_seen_ids = {}
         # Ensure any IDs added via the poller without a timestamp get one now.
         # Iterate over a snapshot because the poller thread may add to
         # ``self._seen_ids`` concurrently.
-        now = datetime.datetime.now(datetime.UTC)
-        now_iso = now.isoformat()
+        now_iso = datetime.datetime.now(datetime.UTC).isoformat()
         for entry_id in set(self._seen_ids):
             self._seen_ids_timestamps.setdefault(entry_id, now_iso)
 
         # Prune stale entries so memory and state.json don't grow without bound
         # during long-running sessions (not just on the next restart).
-        cutoff = now - datetime.timedelta(days=self.config.seen_ids_max_age_days)
-        pruned: dict[str, str] = {}
-        for entry_id, ts in self._seen_ids_timestamps.items():
-            try:
-                seen_at = datetime.datetime.fromisoformat(ts)
-                if seen_at.tzinfo is None:
-                    seen_at = seen_at.replace(tzinfo=datetime.UTC)
-                if seen_at >= cutoff:
-                    pruned[entry_id] = ts
-            except (ValueError, TypeError):
-                pass  # Drop entries with invalid timestamps
-
+        pruned = prune_seen_ids(
+            self._seen_ids_timestamps, self.config.seen_ids_max_age_days,
+        )
         self._seen_ids_timestamps = pruned
         self._seen_ids.intersection_update(pruned)
         self._state["seen_ids"] = self._seen_ids_timestamps
-        save_state(self._state)
+
+        # Hand the worker a copy, as the live map keeps changing.  The log is
+        # rotated now so IDs appended while the write is pending survive it.
+        snapshot = {**self._state, "seen_ids": dict(pruned)}
+        seen_logs = rotate_seen_log()
+        self._state_writer.start(
+            functools.partial(save_state, snapshot, seen_logs=seen_logs),
+        )
 
     def _quit(self) -> None:
         """Shut down the application cleanly.
@@ -535,12 +669,24 @@ class JinkiesApp:
         the application exits after a short grace period.
         """
         self._save_state()
+        self.dashboard.flush_entries_store()
+        self._state_writer.waitForDone()
         self.poller.requestInterruption()
         self.poller.resume()  # Unblock if paused
         self.poller.wait(5000)
+        if self._feed_validators() != self._saved_feed_validators:
+            save_config(self.config)
         self._tray.hide()
         self.app.quit()
 
+    def _feed_validators(self) -> dict[str, tuple[str | None, str | None]]:
+        """Return each feed's conditional-GET validators.
+
+        Returns:
+            Mapping of feed URL → ``(etag, modified)``.
+        """
+        return {feed.url: (feed.etag, feed.modified) for feed in self.config.feeds}
+
     def run(self) -> int:
         """Show the dashboard and start the event loop.
 
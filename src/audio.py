@@ -6,13 +6,24 @@ Generates default sounds programmatically if WAV files are missing.
 
 from __future__ import annotations
 
+import functools
 import math
-import struct
+import sys
 import wave
+from array import array
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QUrl
-from PySide6.QtMultimedia import QSoundEffect
+
+if TYPE_CHECKING:
+    from PySide6.QtMultimedia import QSoundEffect
+
+SAMPLE_RATE = 44100
+
+# Written to the sounds directory after the default sounds have been
+# generated there, so later launches can skip checking each file.
+GENERATED_MARKER = ".generated_v1"
 
 
 def get_sounds_dir() -> Path:
@@ -23,8 +34,6 @@ def get_sounds_dir() -> Path:
     Returns:
         Path to the sounds directory.
     """
-    import sys
-
     if getattr(sys, "frozen", False):
         base = Path(sys._MEIPASS)  # noqa: SLF001
     else:
@@ -32,6 +41,31 @@ def get_sounds_dir() -> Path:
     return base / "sounds"
 
 
+@functools.lru_cache(maxsize=8)
+def _sine_frames(frequency: float, duration: float, volume: float) -> bytes:
+    """Synthesize a sine tone as 16-bit little-endian mono PCM frames.
+
+    Results are cached so identical tones are only synthesized once per
+    process.
+
+    Args:
+        frequency: Tone frequency in Hz.
+        duration: Duration in seconds.
+        volume: Volume from 0.0 to 1.0.
+
+    Returns:
+        The raw frame data.
+    """
+    n_samples = int(SAMPLE_RATE * duration)
+    max_amplitude = int(32767 * volume)
+    step = 2 * math.pi * frequency / SAMPLE_RATE
+
+    samples = array("h", [int(max_amplitude * math.sin(step * i)) for i in range(n_samples)])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
 def generate_wav(path: Path, frequency: float, duration: float, volume: float = 0.5) -> None:
     """Generate a simple sine wave WAV file.
 
@@ -41,35 +75,44 @@ def generate_wav(path: Path, frequency: float, duration: float, volume: float =
         duration: Duration in seconds.
         volume: Volume from 0.0 to 1.0.
     """
-    sample_rate = 44100
-    n_samples = int(sample_rate * duration)
-    max_amplitude = int(32767 * volume)
+    frames = _sine_frames(frequency, duration, volume)
 
     path.parent.mkdir(parents=True, exist_ok=True)
     with wave.open(str(path), "w") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        for i in range(n_samples):
-            sample = max_amplitude * math.sin(2 * math.pi * frequency * i / sample_rate)
-            wav_file.writeframes(struct.pack("<h", int(sample)))
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(frames)
 
 
 def ensure_default_sounds(sounds_dir: Path | None = None) -> None:
     """Generate default sound files if they don't exist.
 
+    Once the defaults have been generated into *sounds_dir* a marker file
+    is written there, and later calls return after checking only that
+    marker.  Directories that ship the sounds (e.g. the repository or a
+    frozen bundle) never get a marker and are checked file by file.
+
     Args:
         sounds_dir: Override sounds directory path.
     """
     sounds_dir = sounds_dir or get_sounds_dir()
+    marker = sounds_dir / GENERATED_MARKER
+    if marker.exists():
+        return
+
     defaults = {
         "new_entry.wav": (440.0, 0.3),
         "error.wav": (220.0, 0.5),
     }
+    generated = False
     for filename, (freq, dur) in defaults.items():
         path = sounds_dir / filename
         if not path.exists():
             generate_wav(path, freq, dur)
+            generated = True
+    if generated:
+        marker.touch()
 
 
 class AudioPlayer:
@@ -113,13 +156,45 @@ class AudioPlayer:
             path = self.sounds_dir / filename
             cache_key = event_type
 
-        if not path.exists():
-            return
+        effect = self._effects.get(cache_key)
+        if effect is None:
+            effect = self._load_effect(cache_key, path)
+            if effect is None:
+                return
+        effect.play()
 
-        if cache_key not in self._effects:
-            effect = QSoundEffect()
-            effect.setSource(QUrl.fromLocalFile(str(path)))
-            effect.setVolume(0.7)
-            self._effects[cache_key] = effect
+    def preload(self) -> None:
+        """Load the effect for every event in ``sound_map`` ahead of time.
+
+        Decoding a WAV and setting up its buffer takes tens of milliseconds,
+        which would otherwise be paid by the first notification of each type.
+        Must be called from the GUI thread.
+        """
+        for event_type, filename in self.sound_map.items():
+            if filename and event_type not in self._effects:
+                self._load_effect(event_type, self.sounds_dir / filename)
 
-        self._effects[cache_key].play()
+    def _load_effect(self, cache_key: str, path: Path) -> QSoundEffect | None:
+        """Create and cache a sound effect for a WAV file.
+
+        QSoundEffect decodes the file once and replays from memory, so the
+        filesystem is only touched when an effect is first loaded.
+
+        Args:
+            cache_key: Key to cache the effect under.
+            path: Path to the WAV file.
+
+        Returns:
+            The new effect, or ``None`` if the file does not exist.
+        """
+        # Imported on first use: QtMultimedia loads the platform audio
+        # backend, which is not needed until a sound is actually played.
+        from PySide6.QtMultimedia import QSoundEffect
+
+        if not path.exists():
+            return None
+        effect = QSoundEffect()
+        effect.setSource(QUrl.fromLocalFile(str(path)))
+        effect.setVolume(0.7)
+        self._effects[cache_key] = effect
+        return effect
@@ -7,14 +7,27 @@ as defense-in-depth against credential leakage.
 
 from __future__ import annotations
 
+import json
 import logging
 
-import keyring
+# ``keyring`` is imported inside each function rather than here: importing it
+# is slow, and most sessions never touch an authenticated feed.
 
 logger = logging.getLogger(__name__)
 
 _SERVICE_PREFIX = "jinkies"
 
+# Username and token are stored together under one key so a lookup costs a
+# single keyring round-trip.  Older versions stored them under separate
+# "username" and "token" keys, which are still read as a fallback.
+_CREDENTIALS_KEY = "credentials"
+_LEGACY_KEYS = ("username", "token")
+
+# Lookup results by feed URL.  Keyring reads go through OS IPC and can take
+# several milliseconds; store/delete keep this in step, so only edits made
+# outside Jinkies go unseen until the next start.
+_credential_cache: dict[str, tuple[str, str] | None] = {}
+
 
 def _service_name(feed_url: str) -> str:
     """Build the keyring service name for a feed URL.
@@ -56,16 +69,23 @@ def store_credentials(feed_url: str, username: str, token: str) -> None:
     Raises:
         ValueError: If the feed URL is not HTTPS.
     """
+    import keyring
+
     _require_https(feed_url)
     service = _service_name(feed_url)
-    keyring.set_password(service, "username", username)
-    keyring.set_password(service, "token", token)
+    payload = json.dumps({"u": username, "t": token})
+    keyring.set_password(service, _CREDENTIALS_KEY, payload)
+    _credential_cache.pop(feed_url, None)
     logger.debug("Stored credentials for %s", feed_url)
 
 
 def get_credentials(feed_url: str) -> tuple[str, str] | None:
     """Retrieve authentication credentials from the OS keyring.
 
+    Credentials saved by older versions under separate username and token
+    keys are still found, at the cost of two extra lookups.  Results are
+    cached per URL until the credentials are stored or deleted.
+
     Args:
         feed_url: The feed URL to look up credentials for.
 
@@ -73,7 +93,39 @@ def get_credentials(feed_url: str) -> tuple[str, str] | None:
         A ``(username, token)`` tuple, or ``None`` if no credentials
         are stored for this feed.
     """
+    try:
+        return _credential_cache[feed_url]
+    except KeyError:
+        pass
+    creds = _read_credentials(feed_url)
+    _credential_cache[feed_url] = creds
+    return creds
+
+
+def _read_credentials(feed_url: str) -> tuple[str, str] | None:
+    """Look up credentials in the keyring, bypassing the cache.
+
+    Args:
+        feed_url: The feed URL to look up credentials for.
+
+    Returns:
+        A ``(username, token)`` tuple, or ``None`` if none are stored.
+    """
+    import keyring
+
     service = _service_name(feed_url)
+    payload = keyring.get_password(service, _CREDENTIALS_KEY)
+    if payload is not None:
+        try:
+            data = json.loads(payload)
+            username, token = data["u"], data["t"]
+        except (json.JSONDecodeError, TypeError, KeyError):
+            logger.warning("Ignoring malformed keyring entry for %s", feed_url)
+        else:
+            if username and token:
+                return (username, token)
+            return None
+
     username = keyring.get_password(service, "username")
     token = keyring.get_password(service, "token")
     if username and token:
@@ -87,13 +139,22 @@ def delete_credentials(feed_url: str) -> None:
     Args:
         feed_url: The feed URL whose credentials should be deleted.
     """
+    import keyring
+
     service = _service_name(feed_url)
-    try:
-        keyring.delete_password(service, "username")
-    except keyring.errors.PasswordDeleteError:
-        pass
-    try:
-        keyring.delete_password(service, "token")
-    except keyring.errors.PasswordDeleteError:
-        pass
+    for key in (_CREDENTIALS_KEY, *_LEGACY_KEYS):
+        try:
+            keyring.delete_password(service, key)
+        except keyring.errors.PasswordDeleteError:
+            pass
+    _credential_cache[feed_url] = None
     logger.debug("Deleted credentials for %s", feed_url)
+
+
+def clear_credential_cache() -> None:
+    """Forget all cached credential lookups.
+
+    The next :func:`get_credentials` call for each feed reads the keyring
+    again.
+    """
+    _credential_cache.clear()
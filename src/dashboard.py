@@ -7,11 +7,21 @@ actions for managing feeds and controlling polling.
 from __future__ import annotations
 
 import datetime
-import json
+import logging
+from collections import Counter, defaultdict
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QPoint, Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QDesktopServices, QKeySequence
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPoint,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QCloseEvent, QColor, QDesktopServices, QKeySequence
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -28,19 +38,163 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSplitter,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QToolBar,
     QVBoxLayout,
     QWidget,
 )
 
-from src.config import get_config_dir
+from src.config import (
+    append_json_lines,
+    get_config_dir,
+    read_json,
+    read_json_lines,
+    write_json,
+)
 from src.models import FeedEntry
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from src.models import Feed
 
+logger = logging.getLogger(__name__)
+
+
+# New entries are appended to a JSON-lines log next to store.json instead of
+# rewriting the whole store after every poll.  Once the log grows past this
+# size, or whenever an existing entry changes, a full snapshot is written and
+# the log removed.
+ENTRIES_LOG_COMPACT_BYTES = 1024 * 1024
+
+# Store writes are coalesced for this long so that bursts of polls or
+# mark-as-seen clicks reach the disk once.
+STORE_SAVE_DELAY_MS = 500
+
+
+class EntryTableModel(QAbstractTableModel):
+    """Table model exposing one page of feed entries to a QTableView.
+
+    Cell text is computed on demand in :meth:`data`, so populating or
+    updating the table never allocates per-cell item objects.
+
+    Attributes:
+        HEADERS: Column header labels, in column order.
+    """
+
+    HEADERS = ("Title", "Feed", "Published", "Status")
+
+    def __init__(self, feed_name_for: Callable[[str], str]) -> None:
+        """Initialize an empty model.
+
+        Args:
+            feed_name_for: Callable mapping a feed URL to its display name.
+        """
+        super().__init__()
+        self._feed_name_for = feed_name_for
+        self._entries: list[FeedEntry] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of entries in the model."""
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        """Return the display text for a cell."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        column = index.column()
+        if column == 0:
+            return entry.title
+        if column == 1:
+            return self._feed_name_for(entry.feed_url)
+        if column == 2:
+            return entry.published
+        return "Seen" if entry.seen else "New"
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        """Return the column header labels."""
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def entry(self, row: int) -> FeedEntry | None:
+        """Return the entry shown at a model row.
+
+        Args:
+            row: Zero-based source row.
+
+        Returns:
+            The entry, or ``None`` if the row is out of range.
+        """
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def set_entries(self, entries: list[FeedEntry]) -> None:
+        """Replace the model contents.
+
+        Args:
+            entries: Entries in display (newest-first) order.
+        """
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def refresh_status(self) -> None:
+        """Repaint the Status column after entries were marked seen.
+
+        Emits a single ``dataChanged`` for the column instead of resetting
+        the model, so the view keeps its selection and scroll position.
+        """
+        if not self._entries:
+            return
+        column = len(self.HEADERS) - 1
+        self.dataChanged.emit(
+            self.index(0, column),
+            self.index(len(self._entries) - 1, column),
+            [Qt.ItemDataRole.DisplayRole],
+        )
+
+    def prepend_entries(self, entries: list[FeedEntry]) -> None:
+        """Insert entries at the top of the model.
+
+        Args:
+            entries: Entries in display (newest-first) order.
+        """
+        if not entries:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        self._entries[:0] = entries
+        self.endInsertRows()
+
+    def remove_last(self, count: int) -> None:
+        """Remove up to *count* rows from the bottom of the model.
+
+        Args:
+            count: Number of rows to remove.
+        """
+        count = min(count, len(self._entries))
+        if count <= 0:
+            return
+        first = len(self._entries) - count
+        self.beginRemoveRows(QModelIndex(), first, len(self._entries) - 1)
+        del self._entries[first:]
+        self.endRemoveRows()
+
 
 class Dashboard(QMainWindow):
     """Main application window showing feeds, entries, and stats.
@@ -69,16 +223,28 @@ class Dashboard(QMainWindow):
     #: ``None`` (mark all feeds) or a feed *name* string (scope to one feed).
     mark_all_seen_requested = Signal(object)
 
-    def __init__(self) -> None:
-        """Initialize the dashboard window."""
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize the dashboard window.
+
+        Args:
+            max_entries: Maximum number of entries to keep.  Applied while the
+                entry store is loaded, so entries beyond the cap are never built.
+        """
         super().__init__()
         self.setWindowTitle("Jinkies — Feed Monitor")
         self.setMinimumSize(800, 500)
         self.entries: list[FeedEntry] = []
-        self.max_entries: int = 10_000
+        self.max_entries: int = max_entries
         self.page_size: int = 100
         self._current_page: int = 0
 
+        self._pending_new_entries: list[FeedEntry] = []
+        self._snapshot_pending = False
+        self._store_save_timer = QTimer(self)
+        self._store_save_timer.setSingleShot(True)
+        self._store_save_timer.setInterval(STORE_SAVE_DELAY_MS)
+        self._store_save_timer.timeout.connect(self.flush_entries_store)
+
         # Create store at default location if it doesnt exist
         self._entries_store_location = get_config_dir() / "store.json"
         if not self._entries_store_location.exists():
@@ -95,6 +261,8 @@ class Dashboard(QMainWindow):
         self._is_paused = False
         self._feed_errors: dict[str, str] = {}
         self._feed_backoff: dict[str, int] = {}  # url → backoff seconds
+        self._feed_items: dict[str, QListWidgetItem] = {}  # url → feed list item
+        self._feed_name_by_url: dict[str, str] = {}  # url → display name
 
         self._setup_toolbar()
         self._setup_central()
@@ -115,46 +283,135 @@ class Dashboard(QMainWindow):
     def _update_entries_store(self) -> None:
         """Updates class entries using local store file.
 
-        Also loads the persisted stats_date so that missed-midnight resets
-        (i.e. when the app was closed over midnight) can be detected on startup.
-        Entries exceeding :attr:`max_entries` are trimmed (oldest first) after
-        loading so the in-memory list always respects the configured limit.
+        Entries appended to the store log since the last snapshot are loaded
+        after those in the snapshot.  Also loads the persisted stats_date so
+        that missed-midnight resets (i.e. when the app was closed over
+        midnight) can be detected on startup.  Entries exceeding
+        :attr:`max_entries` are trimmed (oldest first) after loading so the
+        in-memory list always respects the configured limit.
         """
-        with open(self._entries_store_location) as store:
-            try:
-                data = json.load(store)
-            except Exception:
-                data = {"entries": []}
-
-            # Create a new FeedEntry from the json and append to self.entries
-            # Since this happens in Dashboard constructor, we don't need any deduplation logic.
-            for entry_data in data["entries"]:
-                self.entries.append(FeedEntry.from_dict(entry_data))
-
-            # Enforce the cap immediately so memory usage is bounded even when
-            # the store was written with a larger limit or is externally edited.
-            if len(self.entries) > self.max_entries:
-                self.entries = self.entries[-self.max_entries:]
-
-            # Restore the date the daily counters were last reset.  If absent
-            # (e.g. first run after upgrade), default to "yesterday" so that the
-            # startup check below will immediately trigger a reset and save today.
-            raw_date = data.get("stats_date")
+        data = read_json(self._entries_store_location)
+
+        # Only the newest max_entries stored entries can survive the cap,
+        # so skip building FeedEntry objects for the rest.
+        stored = data.get("entries", [])
+        entries = FeedEntry.from_dicts(stored[-self.max_entries:])
+
+        # A crash between writing a snapshot and removing the log can
+        # leave entries in both, so only logged entries are deduplicated.
+        loaded_ids = {entry_data["entry_id"] for entry_data in stored}
+        for entry in self._read_entries_log():
+            if entry.entry_id not in loaded_ids:
+                loaded_ids.add(entry.entry_id)
+                entries.append(entry)
+
+        # Enforce the cap immediately so memory usage is bounded even when
+        # the store was written with a larger limit or is externally edited.
+        self.entries = entries[-self.max_entries:]
+
+        # Restore the date the daily counters were last reset.  If absent
+        # (e.g. first run after upgrade), default to "yesterday" so that the
+        # startup check below will immediately trigger a reset and save today.
+        raw_date = data.get("stats_date")
+        try:
+            self._stats_date: datetime.date = datetime.date.fromisoformat(raw_date)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            self._stats_date = datetime.date.today() - datetime.timedelta(days=1)
+
+    @property
+    def entries(self) -> list[FeedEntry]:
+        """All loaded entries in chronological order (oldest first)."""
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: list[FeedEntry]) -> None:
+        self._entries = entries
+        self._entries_by_feed: defaultdict[str, list[FeedEntry]] = defaultdict(list)
+        for entry in entries:
+            self._entries_by_feed[entry.feed_url].append(entry)
+
+    @property
+    def _entries_log_location(self) -> Path:
+        """Path of the JSON-lines log of entries added since the last snapshot."""
+        return self._entries_store_location.with_suffix(".log")
+
+    def _read_entries_log(self) -> list[FeedEntry]:
+        """Read the entries appended to the store log.
+
+        Records that don't describe an entry are skipped.
+
+        Returns:
+            The logged entries in the order they were appended.
+        """
+        path = self._entries_log_location
+        entries: list[FeedEntry] = []
+        for record in read_json_lines(path):
             try:
-                self._stats_date: datetime.date = datetime.date.fromisoformat(raw_date)  # type: ignore[arg-type]
-            except (TypeError, ValueError):
-                self._stats_date = datetime.date.today() - datetime.timedelta(days=1)
+                entries.append(FeedEntry.from_dict(record))
+            except (TypeError, KeyError):
+                logger.debug("Skipping malformed record in %s: %r", path, record)
+        return entries
+
+    def _append_entries_store(self, entries: Iterable[FeedEntry]) -> None:
+        """Append new entries to the store log.
+
+        A full snapshot is written instead once the log grows past
+        ``ENTRIES_LOG_COMPACT_BYTES``.
+
+        Args:
+            entries: Newly added entries, oldest first.
+        """
+        log_size = append_json_lines(
+            self._entries_log_location, (e.to_dict() for e in entries)
+        )
+        if log_size > ENTRIES_LOG_COMPACT_BYTES:
+            self._save_entries_store()
+
+    def _schedule_entries_snapshot(self) -> None:
+        """Schedule a full store snapshot after existing entries change."""
+        self._snapshot_pending = True
+        self._store_save_timer.start()
+
+    def flush_entries_store(self) -> None:
+        """Write any pending store changes to disk now.
+
+        Called by the store save timer, and on close so that coalesced
+        changes are not lost.
+        """
+        self._store_save_timer.stop()
+        if self._snapshot_pending:
+            self._save_entries_store()
+        elif self._pending_new_entries:
+            pending, self._pending_new_entries = self._pending_new_entries, []
+            self._append_entries_store(pending)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Flush pending store changes before the window closes.
+
+        Args:
+            event: The close event.
+        """
+        self.flush_entries_store()
+        super().closeEvent(event)
 
     def _save_entries_store(self) -> None:
-        """Updates the local store file with the class' entries list and stats_date."""
-        with open(self._entries_store_location, "w") as store:
-            json.dump(
-                {
-                    "entries": [e.to_dict() for e in self.entries],
-                    "stats_date": self._stats_date.isoformat(),
-                },
-                store,
-            )
+        """Updates the local store file with the class' entries list and stats_date.
+
+        The store log is folded into the snapshot and removed.  The snapshot
+        also covers any pending changes, so they are cleared.
+        """
+        self._store_save_timer.stop()
+        self._snapshot_pending = False
+        self._pending_new_entries = []
+        data = {
+            "entries": [e.to_dict() for e in self.entries],
+            "stats_date": self._stats_date.isoformat(),
+        }
+        # The snapshot must be fully in place before the log is removed, or a
+        # crash in between would lose the logged entries.  It is rebuilt from
+        # memory often enough that fsyncing every write isn't worth it.
+        write_json(self._entries_store_location, data, durable=False, compact=True)
+        self._entries_log_location.unlink(missing_ok=True)
 
     def _setup_toolbar(self) -> None:
         """Create the main toolbar with action buttons."""
@@ -234,20 +491,20 @@ class Dashboard(QMainWindow):
         self._feed_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         splitter.addWidget(self._feed_list)
 
-        self._entry_table = QTableWidget(0, 4)
-        self._entry_table.setHorizontalHeaderLabels(["Title", "Feed", "Published", "Status"])
-        self._entry_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeMode.Stretch
-        )
-        self._entry_table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.ResizeMode.ResizeToContents
-        )
-        self._entry_table.horizontalHeader().setSectionResizeMode(
-            2, QHeaderView.ResizeMode.ResizeToContents
-        )
-        self._entry_table.horizontalHeader().setSectionResizeMode(
-            3, QHeaderView.ResizeMode.ResizeToContents
-        )
+        self._entry_model = EntryTableModel(self._feed_name_for)
+        self._entry_proxy = QSortFilterProxyModel(self)
+        self._entry_proxy.setSourceModel(self._entry_model)
+        self._entry_table = QTableView()
+        self._entry_table.setModel(self._entry_proxy)
+        self._entry_table.verticalHeader().setVisible(False)
+        header = self._entry_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        # No sort column until the user clicks a header, so rows keep the
+        # model's newest-first order.
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self._entry_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._entry_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._entry_table.setSortingEnabled(True)
@@ -290,6 +547,8 @@ class Dashboard(QMainWindow):
             feeds: Current list of Feed objects.
         """
         self._feed_list.clear()
+        self._feed_items = {}
+        self._feed_name_by_url = {}
         self._filter_combo.clear()
         self._filter_combo.addItem("All Feeds")
 
@@ -304,8 +563,32 @@ class Dashboard(QMainWindow):
                 color = QColor(0, 180, 0) if feed.enabled else QColor(150, 150, 150)
                 item.setForeground(color)
             self._feed_list.addItem(item)
+            self._feed_items.setdefault(feed.url, item)
+            self._feed_name_by_url.setdefault(feed.url, feed.name)
             self._filter_combo.addItem(feed.name)
 
+    def remove_feeds(self, indices: list[int]) -> None:
+        """Remove feeds from the feed list panel without rebuilding it.
+
+        Args:
+            indices: Zero-based positions of the feeds to remove, matching
+                the order passed to :meth:`update_feeds`.
+        """
+        for i in sorted(set(indices), reverse=True):
+            item = self._feed_list.takeItem(i)
+            if item is None:
+                continue
+            url = item.data(Qt.ItemDataRole.UserRole)
+            if self._feed_items.get(url) is item:
+                del self._feed_items[url]
+                self._feed_name_by_url.pop(url, None)
+                self._feed_errors.pop(url, None)
+                self._feed_backoff.pop(url, None)
+            # The filter combo lists the same feeds after its "All Feeds" entry
+            if self._filter_combo.currentIndex() == i + 1:
+                self._filter_combo.setCurrentIndex(0)
+            self._filter_combo.removeItem(i + 1)
+
     def add_entries(self, new_entries: list[FeedEntry]) -> None:
         """Add new entries to the table and update stats.
 
@@ -331,14 +614,22 @@ class Dashboard(QMainWindow):
         num_evicted = max(0, total_after - self.max_entries)
         evicted = self.entries[:num_evicted] if num_evicted > 0 else []
 
-        self.entries.extend(unique_new)
-        if len(self.entries) > self.max_entries:
-            self.entries = self.entries[-self.max_entries:]
+        self._entries.extend(unique_new)
+        for entry in unique_new:
+            self._entries_by_feed[entry.feed_url].append(entry)
+        if num_evicted:
+            # The trimmed entries are the oldest overall, so they are also the
+            # oldest of their own feeds and sit at the front of those lists.
+            trimmed = Counter(e.feed_url for e in self._entries[:num_evicted])
+            self._entries = self._entries[num_evicted:]
+            for url, count in trimmed.items():
+                del self._entries_by_feed[url][:count]
 
         self._entries_today += len(unique_new)
         self._insert_new_rows(unique_new, evicted)
         self._update_stats()
-        self._save_entries_store()
+        self._pending_new_entries.extend(unique_new)
+        self._store_save_timer.start()
 
     def _insert_new_rows(
         self, new_entries: list[FeedEntry], evicted: list[FeedEntry]
@@ -368,28 +659,13 @@ class Dashboard(QMainWindow):
         if not filtered_new and evicted_count == 0:
             return
 
-        self._entry_table.setSortingEnabled(False)
-
-        # Prepend each new entry at row 0.  Inserting in forward order means
-        # the last element of filtered_new (appended most recently to
-        # self.entries) ends up at row 0, matching the reversed display order
+        # The last element of filtered_new (appended most recently to
+        # self.entries) goes on top, matching the reversed display order
         # produced by _refresh_table.
-        for entry in filtered_new:
-            self._entry_table.insertRow(0)
-            self._entry_table.setItem(0, 0, QTableWidgetItem(entry.title))
-            self._entry_table.setItem(
-                0, 1, QTableWidgetItem(self._feed_name_for(entry.feed_url))
-            )
-            self._entry_table.setItem(0, 2, QTableWidgetItem(entry.published))
-            self._entry_table.setItem(0, 3, QTableWidgetItem("Seen" if entry.seen else "New"))
+        self._entry_model.prepend_entries(filtered_new[::-1])
 
         # Remove evicted rows from the bottom of the table.
-        for _ in range(evicted_count):
-            last_row = self._entry_table.rowCount() - 1
-            if last_row >= 0:
-                self._entry_table.removeRow(last_row)
-
-        self._entry_table.setSortingEnabled(True)
+        self._entry_model.remove_last(evicted_count)
 
     def _get_display_entries(self) -> list[FeedEntry]:
         """Return entries filtered by the active feed filter and search text.
@@ -406,10 +682,7 @@ class Dashboard(QMainWindow):
         current_filter = self._filter_combo.currentText()
         filtered: list[FeedEntry] = self.entries
         if current_filter != "All Feeds":
-            filtered = [
-                e for e in filtered
-                if self._feed_name_for(e.feed_url) == current_filter
-            ]
+            filtered = self._entries_for_feed_name(current_filter)
 
         search = self._search_input.text().strip().lower()
         if search:
@@ -422,31 +695,46 @@ class Dashboard(QMainWindow):
 
         return filtered
 
+    def _entries_for_feed_name(self, name: str) -> list[FeedEntry]:
+        """Return the entries shown under a feed's display name.
+
+        Looks the entries up in the per-feed index, so the cost is in the
+        number of matching entries rather than all entries.  The returned
+        list may be the index's own and must not be modified.
+
+        Args:
+            name: The feed display name, as listed in the filter combo.
+
+        Returns:
+            Matching entries in chronological order.
+        """
+        urls = [url for url, feed_name in self._feed_name_by_url.items() if feed_name == name]
+        # Entries of feeds that are no longer configured display their URL
+        if name in self._entries_by_feed and name not in self._feed_name_by_url:
+            urls.append(name)
+        if len(urls) == 1:
+            return self._entries_by_feed.get(urls[0], [])
+        # Several feeds share the name; scan to keep their entries interleaved
+        wanted = set(urls)
+        return [e for e in self.entries if e.feed_url in wanted]
+
     def _refresh_table(self) -> None:
         """Rebuild the entry table from current entries, filter, search, and current page."""
         filtered = self._get_display_entries()
 
-        reversed_filtered = list(reversed(filtered))
-        total = len(reversed_filtered)
+        total = len(filtered)
         total_pages = max(1, -(-total // self.page_size))  # ceiling division
 
         # Clamp current page to valid range
         self._current_page = max(0, min(self._current_page, total_pages - 1))
 
-        page_offset = self._current_page * self.page_size
-        page_entries = reversed_filtered[page_offset: page_offset + self.page_size]
+        # Pages count back from the newest entry; slice the page straight out
+        # of the chronological list instead of reversing all of it first.
+        page_end = total - self._current_page * self.page_size
+        page_start = max(0, page_end - self.page_size)
+        page_entries = filtered[page_start:page_end][::-1]
 
-        self._entry_table.setSortingEnabled(False)
-        self._entry_table.setRowCount(len(page_entries))
-        for row, entry in enumerate(page_entries):
-            self._entry_table.setItem(row, 0, QTableWidgetItem(entry.title))
-            self._entry_table.setItem(
-                row, 1, QTableWidgetItem(self._feed_name_for(entry.feed_url))
-            )
-            self._entry_table.setItem(row, 2, QTableWidgetItem(entry.published))
-            status = "Seen" if entry.seen else "New"
-            self._entry_table.setItem(row, 3, QTableWidgetItem(status))
-        self._entry_table.setSortingEnabled(True)
+        self._entry_model.set_entries(page_entries)
 
         # Update pagination controls
         show_pagination = total > self.page_size
@@ -465,11 +753,7 @@ class Dashboard(QMainWindow):
         Returns:
             The feed name, or the URL if not found.
         """
-        for i in range(self._feed_list.count()):
-            item = self._feed_list.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole) == url:
-                return item.text()
-        return url
+        return self._feed_name_by_url.get(url, url)
 
     def update_feed_names_mapping(self, feeds: list[Feed]) -> None:
         """Store feed URL-to-name mapping in list items' user data.
@@ -477,11 +761,15 @@ class Dashboard(QMainWindow):
         Args:
             feeds: Current list of feeds.
         """
+        self._feed_items = {}
+        self._feed_name_by_url = {}
         for i, feed in enumerate(feeds):
             if i < self._feed_list.count():
                 item = self._feed_list.item(i)
                 if item:
                     item.setData(Qt.ItemDataRole.UserRole, feed.url)
+                    self._feed_items.setdefault(feed.url, item)
+                    self._feed_name_by_url.setdefault(feed.url, item.text())
 
     def record_error(self) -> None:
         """Increment the error counter and update stats display."""
@@ -541,23 +829,22 @@ class Dashboard(QMainWindow):
         Args:
             url: The feed URL whose list item should be updated.
         """
-        for i in range(self._feed_list.count()):
-            item = self._feed_list.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole) == url:
-                if url in self._feed_errors:
-                    item.setForeground(QColor(200, 50, 50))
-                    tooltip = f"Error: {self._feed_errors[url]}"
-                    backoff = self._feed_backoff.get(url, 0)
-                    if backoff:
-                        mins = max(1, round(backoff / 60))
-                        tooltip += f"\nRetrying in ~{mins} min (backoff)"
-                    item.setToolTip(tooltip)
-                else:
-                    enabled = item.data(Qt.ItemDataRole.UserRole + 1)
-                    color = QColor(0, 180, 0) if enabled else QColor(150, 150, 150)
-                    item.setForeground(color)
-                    item.setToolTip("")
-                break
+        item = self._feed_items.get(url)
+        if item is None:
+            return
+        if url in self._feed_errors:
+            item.setForeground(QColor(200, 50, 50))
+            tooltip = f"Error: {self._feed_errors[url]}"
+            backoff = self._feed_backoff.get(url, 0)
+            if backoff:
+                mins = max(1, round(backoff / 60))
+                tooltip += f"\nRetrying in ~{mins} min (backoff)"
+            item.setToolTip(tooltip)
+        else:
+            enabled = item.data(Qt.ItemDataRole.UserRole + 1)
+            color = QColor(0, 180, 0) if enabled else QColor(150, 150, 150)
+            item.setForeground(color)
+            item.setToolTip("")
 
     def set_last_poll_time(self, time_str: str) -> None:
         """Update the last poll time display.
@@ -614,28 +901,25 @@ class Dashboard(QMainWindow):
         self._current_page += 1
         self._refresh_table()
 
-    def _on_entry_double_click(self, index: object) -> None:
+    def _on_entry_double_click(self, index: QModelIndex) -> None:
         """Open the entry link in the default browser on double-click.
 
-        Marks the entry as seen and immediately persists the updated state
-        to disk, so the seen status survives application restarts even if
-        the next periodic save has not yet occurred.
+        Marks the entry as seen and schedules a store snapshot, so the seen
+        status survives application restarts.
 
         Args:
-            index: The model index of the double-clicked row.
+            index: The view (proxy) index of the double-clicked row.
         """
-        row = index.row()  # type: ignore[union-attr]
-        reversed_filtered = list(reversed(self._get_display_entries()))
-        actual_index = self._current_page * self.page_size + row
-        if 0 <= actual_index < len(reversed_filtered):
-            entry = reversed_filtered[actual_index]
-            if entry.link and (entry.link.startswith("http") or entry.link.startswith("https")):
-                from PySide6.QtCore import QUrl
+        entry = self._entry_model.entry(self._entry_proxy.mapToSource(index).row())
+        if entry is None:
+            return
+        if entry.link and (entry.link.startswith("http") or entry.link.startswith("https")):
+            from PySide6.QtCore import QUrl
 
-                QDesktopServices.openUrl(QUrl(entry.link))
-                entry.seen = True
-                self._save_entries_store()
-                self._refresh_table()
+            QDesktopServices.openUrl(QUrl(entry.link))
+            entry.seen = True
+            self._schedule_entries_snapshot()
+            self._entry_model.refresh_status()
 
     def _on_entry_table_context_menu(self, pos: QPoint) -> None:
         """Show a right-click context menu for the entry table.
@@ -697,40 +981,38 @@ class Dashboard(QMainWindow):
                 marked as seen.  Pass ``None`` to mark entries across all feeds.
         """
         changed = False
-        for entry in self.entries:
-            in_scope = feed_name is None or self._feed_name_for(entry.feed_url) == feed_name
-            if in_scope and not entry.seen:
+        scope = self.entries if feed_name is None else self._entries_for_feed_name(feed_name)
+        for entry in scope:
+            if not entry.seen:
                 entry.seen = True
                 changed = True
 
         if changed:
-            self._save_entries_store()
-            self._refresh_table()
+            self._schedule_entries_snapshot()
+            self._entry_model.refresh_status()
 
     def _mark_selected_seen(self) -> None:
         """Mark the currently selected table rows as seen.
 
-        Resolves which :class:`~src.models.FeedEntry` objects correspond to the
-        selected row indices (accounting for the reversed display order, the
-        active filter, and the current page offset) and marks each unseen one
-        as seen before persisting.
+        Maps the selected view rows through the sort proxy to the
+        :class:`~src.models.FeedEntry` objects shown on the current page and
+        marks each unseen one as seen before persisting.
         """
-        reversed_filtered = list(reversed(self._get_display_entries()))
-        page_offset = self._current_page * self.page_size
-        selected_rows = sorted({idx.row() for idx in self._entry_table.selectedIndexes()})
+        selected_rows = {
+            self._entry_proxy.mapToSource(idx).row()
+            for idx in self._entry_table.selectionModel().selectedRows()
+        }
 
         changed = False
         for row in selected_rows:
-            actual_index = page_offset + row
-            if 0 <= actual_index < len(reversed_filtered):
-                entry = reversed_filtered[actual_index]
-                if not entry.seen:
-                    entry.seen = True
-                    changed = True
+            entry = self._entry_model.entry(row)
+            if entry is not None and not entry.seen:
+                entry.seen = True
+                changed = True
 
         if changed:
-            self._save_entries_store()
-            self._refresh_table()
+            self._schedule_entries_snapshot()
+            self._entry_model.refresh_status()
 
     def _on_remove_feed_clicked(self) -> None:
         """Emit remove_feed_requested with the indices of all selected feeds.
@@ -769,7 +1051,7 @@ class Dashboard(QMainWindow):
         self._entries_today = 0
         self._errors_today = 0
         self._stats_date = datetime.date.today()
-        self._save_entries_store()
+        self._schedule_entries_snapshot()
         self._update_stats()
 
     def _schedule_daily_reset(self) -> None:
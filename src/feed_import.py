@@ -30,30 +30,35 @@ def import_opml(path: str | Path) -> list[Feed]:
         ValueError: If the file cannot be parsed as valid OPML.
     """
     path = Path(path)
+    feeds: list[Feed] = []
     try:
-        tree = ET.parse(path)
+        # Stream the document instead of building the whole tree first:
+        # outlines are read as they start (keeping document order) and
+        # cleared once they end, so large exports stay cheap to import.
+        for event, element in ET.iterparse(path, events=("start", "end")):
+            if element.tag != "outline":
+                continue
+            if event == "start":
+                _collect_opml_outline(element, feeds)
+            else:
+                element.clear()
     except (ET.ParseError, DefusedXmlException) as e:
         msg = f"Invalid OPML file: {e}"
         raise ValueError(msg) from e
-
-    root = tree.getroot()
-    feeds: list[Feed] = []
-    _collect_opml_outlines(root, feeds)
     return feeds
 
 
-def _collect_opml_outlines(element: Element, feeds: list[Feed]) -> None:
-    """Recursively collect feed outlines from an OPML element tree.
+def _collect_opml_outline(outline: Element, feeds: list[Feed]) -> None:
+    """Collect a feed from a single OPML outline element.
 
     Args:
-        element: Current XML element to search.
-        feeds: List to append discovered feeds to.
+        outline: An ``<outline>`` element; only its attributes are read.
+        feeds: List to append the feed to, if the outline has a valid URL.
     """
-    for outline in element.iter("outline"):
-        xml_url = outline.get("xmlUrl")
-        if xml_url and validate_feed_url(xml_url) is None:
-            name = outline.get("title") or outline.get("text") or xml_url
-            feeds.append(Feed(url=xml_url, name=name))
+    xml_url = outline.get("xmlUrl")
+    if xml_url and validate_feed_url(xml_url) is None:
+        name = outline.get("title") or outline.get("text") or xml_url
+        feeds.append(Feed(url=xml_url, name=name))
 
 
 def import_local_feed(path: str | Path) -> list[Feed]:
@@ -21,17 +21,23 @@ from __future__ import annotations
 
 import base64
 import datetime
+import gzip
 import hashlib
 import http.client
+import io
 import logging
 import time
 import urllib.error
 import urllib.request
 import uuid
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from threading import Event, Lock
 from typing import TYPE_CHECKING
 
+import defusedxml.ElementTree as ET  # noqa: N817
 import feedparser
+from defusedxml import DefusedXmlException
 from PySide6.QtCore import QThread, Signal
 
 from src.credential_store import get_credentials
@@ -39,13 +45,139 @@ from src.models import Feed, FeedEntry
 from src.url_validation import validate_feed_url
 
 if TYPE_CHECKING:
-    pass
+    from xml.etree.ElementTree import Element
 
 logger = logging.getLogger(__name__)
 
 #: Starting backoff interval in seconds (1 minute).
 _BACKOFF_BASE_SECS: int = 60
 
+#: Maximum number of feeds fetched at the same time.
+_MAX_POLL_WORKERS: int = 8
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def _decode_body(content: bytes, content_encoding: str) -> bytes:
+    """Decompress a response body sent with gzip or deflate encoding.
+
+    Args:
+        content: The raw response body.
+        content_encoding: The response's ``Content-Encoding`` header.
+
+    Returns:
+        The decoded body; unencoded bodies are returned unchanged.
+
+    Raises:
+        ValueError: If the body cannot be decompressed.
+    """
+    encoding = content_encoding.strip().lower()
+    try:
+        if encoding == "gzip":
+            return gzip.decompress(content)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(content)
+            except zlib.error:
+                # Some servers send a raw deflate stream without the zlib header.
+                return zlib.decompress(content, -zlib.MAX_WBITS)
+    except (OSError, EOFError, zlib.error) as e:
+        msg = f"Could not decode {encoding} response: {e}"
+        raise ValueError(msg) from e
+    return content
+
+
+def _parse_atom(content: bytes) -> feedparser.FeedParserDict | None:
+    """Parse a plain Atom document without going through feedparser.
+
+    feedparser's pure-Python parser dominates the cost of a poll.  Most
+    Atom feeds (Jenkins among them) only use plain-text constructs and
+    absolute links, which the C expat parser behind ElementTree handles
+    far faster.  Only the fields the poller reads are extracted, matching
+    what feedparser would return for them.  The document is streamed and
+    each entry is discarded once read, so the parsed tree never holds more
+    than one entry.
+
+    Args:
+        content: The raw feed document.
+
+    Returns:
+        A feedparser-style result, or ``None`` if the document is not Atom
+        or uses anything that needs feedparser's handling (HTML or XHTML
+        text constructs, relative links, malformed XML, DTDs).
+    """
+    entries = []
+    try:
+        events = ET.iterparse(io.BytesIO(content), events=("start", "end"))
+        _, root = next(events)
+        if root.tag != f"{_ATOM}feed":
+            return None
+        for event, element in events:
+            if event != "end" or element.tag != f"{_ATOM}entry":
+                continue
+            entry = _parse_atom_entry(element)
+            if entry is None:
+                return None
+            entries.append(entry)
+            root.clear()
+    except (ET.ParseError, DefusedXmlException, StopIteration):
+        return None
+    return feedparser.FeedParserDict(bozo=False, entries=entries)
+
+
+def _parse_atom_entry(element: Element) -> feedparser.FeedParserDict | None:
+    """Extract the fields the poller reads from an Atom ``<entry>``.
+
+    Args:
+        element: The fully parsed entry element.
+
+    Returns:
+        A feedparser-style entry, or ``None`` if the entry needs
+        feedparser's handling.
+    """
+    entry = feedparser.FeedParserDict()
+    for name in ("title", "summary", "content"):
+        child = element.find(f"{_ATOM}{name}")
+        if child is None:
+            continue
+        if child.get("type", "text") != "text":
+            return None
+        if name != "content":
+            entry[name] = (child.text or "").strip()
+        elif "summary" not in entry:
+            entry["summary"] = (child.text or "").strip()
+    for name in ("id", "published", "updated"):
+        text = element.findtext(f"{_ATOM}{name}")
+        if text is not None:
+            entry[name] = text.strip()
+    for link in element.iterfind(f"{_ATOM}link"):
+        if link.get("rel", "alternate") == "alternate":
+            href = link.get("href", "")
+            if "://" not in href:
+                return None
+            entry["link"] = href
+            break
+    return entry
+
+
+def _entry_published(entry: feedparser.FeedParserDict) -> str:
+    """Return an entry's published timestamp, falling back to updated.
+
+    ``updated`` is only looked up when ``published`` is missing: feedparser
+    answers ``updated`` from ``published`` with a DeprecationWarning on every
+    call, which made the eager lookup the costliest part of each entry.
+
+    Args:
+        entry: A feedparser entry mapping.
+
+    Returns:
+        The timestamp string, or ``""`` if the entry has neither field.
+    """
+    published = entry.get("published", None)
+    if published is None:
+        published = entry.get("updated", "")
+    return published
+
 
 class FeedPoller(QThread):
     """Background thread that polls Atom/RSS feeds on a timer.
@@ -94,41 +226,56 @@ class FeedPoller(QThread):
         self.feeds = feeds
         self.poll_interval = poll_interval
         self.seen_ids: set[str] = seen_ids or set()
+        # Feeds are polled concurrently; guards the check-and-add on seen_ids
+        # so an entry shared by two feeds is only reported once.
+        self._seen_ids_lock = Lock()
         self.max_backoff_secs = max_backoff_secs
         self._pause_event = Event()
         self._pause_event.set()  # Start unpaused
         self._sleep_interrupt_event = Event()
-        # Per-feed backoff state (only accessed from the poller thread).
+        # Per-feed backoff state.  Only the pool thread polling a feed touches
+        # that feed's keys, and each feed is polled at most once per cycle.
         self._backoff_counts: dict[str, int] = {}
         self._next_poll_times: dict[str, float] = {}
 
     def run(self) -> None:
         """Execute the polling loop.
 
-        Polls all enabled feeds sequentially, emitting signals for new
-        entries and errors, then sleeps until the next cycle.  Feeds that
+        Polls all enabled feeds concurrently on a small thread pool, so a
+        cycle takes about as long as the slowest feed rather than the sum
+        of all of them.  Signals for new entries and errors are emitted
+        from the pool threads and queued to their receivers.  Feeds that
         are currently in an exponential-backoff window are skipped until
         their backoff delay has elapsed.
         """
-        while not self.isInterruptionRequested():
-            self._pause_event.wait()
-            if self.isInterruptionRequested():
-                break
-
-            with self._feeds_lock:
-                feeds_snapshot = list(self.feeds)
-            for feed in feeds_snapshot:
+        with ThreadPoolExecutor(
+            max_workers=_MAX_POLL_WORKERS, thread_name_prefix="feed-poll"
+        ) as pool:
+            while not self.isInterruptionRequested():
+                self._pause_event.wait()
                 if self.isInterruptionRequested():
                     break
-                if not feed.enabled:
-                    continue
-                if time.time() < self._next_poll_times.get(feed.url, 0.0):
-                    # Feed is still within its backoff window; skip this cycle.
-                    continue
-                self._poll_feed(feed)
 
-            self.poll_complete.emit()
-            self._interruptible_sleep(self.poll_interval)
+                with self._feeds_lock:
+                    feeds_snapshot = list(self.feeds)
+                now = time.time()
+                pending = {
+                    pool.submit(self._poll_feed, feed)
+                    for feed in feeds_snapshot
+                    # Feeds still within their backoff window skip this cycle.
+                    if feed.enabled and now >= self._next_poll_times.get(feed.url, 0.0)
+                }
+                while pending:
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                    if self.isInterruptionRequested():
+                        for future in pending:
+                            future.cancel()
+                        return
+
+                self.poll_complete.emit()
+                self._interruptible_sleep(self.poll_interval)
 
     def _poll_feed(self, feed: Feed) -> None:
         """Poll a single feed and emit signals for new entries.
@@ -150,24 +297,29 @@ class FeedPoller(QThread):
             # Successful parse — reset any active backoff before processing.
             self._handle_poll_success(feed)
 
+            # Most entries in a poll are already seen, so filter the whole
+            # batch with one set difference under a single lock acquisition.
+            entry_ids = [self._get_entry_id(entry) for entry in parsed.entries]
+            with self._seen_ids_lock:
+                unseen = set(entry_ids).difference(self.seen_ids)
+                self.seen_ids.update(unseen)
+
             new_entries = []
-            for entry in parsed.entries:
-                entry_id = self._get_entry_id(entry)
-                if entry_id in self.seen_ids:
+            feed_url = feed.url
+            for entry, entry_id in zip(parsed.entries, entry_ids, strict=True):
+                if entry_id not in unseen:
                     continue
-
-                self.seen_ids.add(entry_id)
-                published = entry.get("published", entry.get("updated", ""))
-                summary = entry.get("summary", "")
+                unseen.discard(entry_id)  # report duplicates within a feed once
+                get = entry.get
                 new_entries.append(
                     FeedEntry(
-                        feed_url=feed.url,
-                        title=entry.get("title", "Untitled"),
-                        link=entry.get("link", ""),
-                        published=published,
+                        feed_url=feed_url,
+                        title=get("title", "Untitled"),
+                        link=get("link", ""),
+                        published=_entry_published(entry),
                         entry_id=entry_id,
                         seen=False,
-                        summary=summary,
+                        summary=get("summary", ""),
                     )
                 )
 
@@ -258,7 +410,7 @@ class FeedPoller(QThread):
 
         title = entry.get("title", "")
         summary = entry.get("summary", "")
-        published = entry.get("published", entry.get("updated", ""))
+        published = _entry_published(entry)
         content = f"{title}|{summary}|{published}"
         if any([title, summary, published]):
             return hashlib.sha256(content.encode()).hexdigest()
@@ -274,7 +426,10 @@ class FeedPoller(QThread):
 
         For feeds with auth credentials, fetches the content manually
         with HTTP Basic auth to bypass content-type issues (e.g. Jenkins
-        serving Atom feeds as text/html).
+        serving Atom feeds as text/html).  These requests negotiate gzip or
+        deflate compression, as feedparser does for the other feeds.  Plain
+        Atom content fetched this way is parsed by :func:`_parse_atom`,
+        falling back to feedparser.
 
         A 30-second socket timeout is applied to all network fetches so
         that a slow or unresponsive server cannot block the poller thread
@@ -302,6 +457,8 @@ class FeedPoller(QThread):
             self.feed_error.emit(feed.url, url_error)
             return feedparser.parse("")
 
+        # Read on every poll: the settings dialog stores and deletes
+        # credentials while it is open, and credential_store caches lookups.
         creds = get_credentials(feed.url)
         if creds:
             if not feed.url.startswith("https://"):
@@ -313,7 +470,10 @@ class FeedPoller(QThread):
             username, token = creds
             credentials = f"{username}:{token}"
             b64 = base64.b64encode(credentials.encode()).decode()
-            headers: dict[str, str] = {"Authorization": f"Basic {b64}"}
+            headers: dict[str, str] = {
+                "Authorization": f"Basic {b64}",
+                "Accept-Encoding": "gzip, deflate",
+            }
             if feed.etag:
                 headers["If-None-Match"] = feed.etag
             if feed.modified:
@@ -324,7 +484,9 @@ class FeedPoller(QThread):
             )
             try:
                 with urllib.request.urlopen(req, timeout=30) as resp:  # noqa: S310
-                    content = resp.read()
+                    content = _decode_body(
+                        resp.read(), resp.headers.get("Content-Encoding") or ""
+                    )
                     etag = resp.headers.get("ETag")
                     last_modified = resp.headers.get("Last-Modified")
             except urllib.error.HTTPError as exc:
@@ -337,7 +499,8 @@ class FeedPoller(QThread):
                 feed.etag = etag
             if last_modified:
                 feed.modified = last_modified
-            return feedparser.parse(content)
+            parsed = _parse_atom(content)
+            return parsed if parsed is not None else feedparser.parse(content)
 
         # Use socket_timeout so a slow or unresponsive server cannot block
         # the poller thread indefinitely and prevent clean shutdown.
@@ -360,25 +523,24 @@ class FeedPoller(QThread):
     def _interruptible_sleep(self, seconds: int) -> None:
         """Sleep for *seconds*, waking early on shutdown or interval change.
 
-        Uses a :class:`threading.Event` so that callers like
-        :meth:`update_interval` can interrupt the sleep immediately instead
-        of waiting for the current interval to expire.
+        Blocks on a single :class:`threading.Event` wait, which
+        :meth:`requestInterruption` and :meth:`update_interval` set to end
+        the sleep immediately, instead of waking periodically to check.
 
         Args:
             seconds: Total seconds to sleep.
         """
         self._sleep_interrupt_event.clear()
-        deadline = time.monotonic() + seconds
-        while True:
-            if self.isInterruptionRequested():
-                return
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                return
-            # Wait up to 0.1 s (or the remaining time if less).
-            # Returns True if the event was set (early wake), False on timeout.
-            if self._sleep_interrupt_event.wait(timeout=min(0.1, remaining)):
-                return
+        # Checked after clearing, so an interruption requested just before
+        # the clear is not missed.
+        if self.isInterruptionRequested():
+            return
+        self._sleep_interrupt_event.wait(timeout=seconds)
+
+    def requestInterruption(self) -> None:
+        """Request the polling loop to stop, waking it if it is sleeping."""
+        super().requestInterruption()
+        self._sleep_interrupt_event.set()
 
     def pause(self) -> None:
         """Pause the polling loop."""
@@ -7,8 +7,12 @@ Feed, FeedEntry, and AppConfig.
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +32,7 @@ _PAGE_SIZE_MIN: int = 1
 _VALID_NOTIFICATION_STYLES: frozenset[str] = frozenset({"native", "custom"})
 
 
-@dataclass
+@dataclass(slots=True)
 class Feed:
     """An Atom/RSS feed to monitor.
 
@@ -107,7 +111,7 @@ class Feed:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedEntry:
     """A single entry from a feed.
 
@@ -155,18 +159,49 @@ class FeedEntry:
         Returns:
             A FeedEntry instance.
         """
-        return cls(
-            feed_url=data["feed_url"],
-            title=data["title"],
-            link=data["link"],
-            published=data.get("published", ""),
-            entry_id=data["entry_id"],
-            seen=data.get("seen", False),
-            summary=data.get("summary", ""),
-        )
+        return _feed_entry_from_dict(data)
+
+    @classmethod
+    def from_dicts(cls, dicts: Iterable[dict[str, Any]]) -> list[FeedEntry]:
+        """Deserialize many entries at once.
+
+        Equivalent to calling :meth:`from_dict` on each item, but maps the
+        shared builder directly, skipping a classmethod call per entry.  The
+        entry store is loaded this way at startup.
 
+        Args:
+            dicts: Dictionaries with entry fields.
 
-@dataclass
+        Returns:
+            A list of FeedEntry instances, in input order.
+        """
+        return list(map(_feed_entry_from_dict, dicts))
+
+
+def _feed_entry_from_dict(data: dict[str, Any]) -> FeedEntry:
+    """Build a FeedEntry from its dictionary form.
+
+    ``feed_url`` is interned so that the entries of one feed share a single
+    string.
+
+    Args:
+        data: Dictionary with entry fields.
+
+    Returns:
+        A FeedEntry instance.
+    """
+    return FeedEntry(
+        feed_url=sys.intern(data["feed_url"]),
+        title=data["title"],
+        link=data["link"],
+        published=data.get("published", ""),
+        entry_id=data["entry_id"],
+        seen=data.get("seen", False),
+        summary=data.get("summary", ""),
+    )
+
+
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration.
 
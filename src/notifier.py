@@ -9,6 +9,7 @@ from __future__ import annotations
 import sys
 from typing import TYPE_CHECKING
 
+import shiboken6
 from PySide6.QtCore import QPropertyAnimation, Qt, QTimer
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import (
@@ -27,7 +28,9 @@ if TYPE_CHECKING:
 # Using a module-level list (rather than a class attribute) avoids the
 # shared-mutable-state problem: the registry is a single, explicit
 # singleton that is not accidentally inherited by subclasses and can be
-# cleared in tests without touching the class itself.
+# cleared in tests without touching the class itself.  It must hold strong
+# references: Notifier.notify keeps none, and a parentless dialog is deleted
+# as soon as its Python wrapper is collected.
 _active_notifications: list[NotificationDialog] = []
 
 
@@ -39,6 +42,37 @@ class NotificationDialog(QDialog):
 
     Attributes:
         _dismiss_timer: Timer for auto-dismissal.
+        _slot: Position in the notification stack, counted up from the
+            bottom of the screen.
+        _anim: Opacity animation, reused for fading in and out.
+        _fading_out: Whether ``_anim`` is running the fade-out, so its
+            ``finished`` signal should dismiss the dialog.
+    """
+
+    _STYLESHEET = """
+        QDialog {
+            background-color: rgba(50, 50, 50, 230);
+            border-radius: 8px;
+        }
+        QLabel#title {
+            color: white;
+            font-weight: bold;
+            font-size: 13px;
+        }
+        QLabel#body {
+            color: #cccccc;
+            font-size: 12px;
+        }
+        QPushButton#close {
+            color: #999999;
+            background: transparent;
+            border: none;
+            font-size: 14px;
+            padding: 2px 6px;
+        }
+        QPushButton#close:hover {
+            color: white;
+        }
     """
 
     def __init__(
@@ -73,6 +107,9 @@ class NotificationDialog(QDialog):
         self._dismiss_timer.timeout.connect(self._fade_out)
         self._dismiss_timer.start(timeout_ms)
 
+        self._anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._fading_out = False
+        self._anim.finished.connect(self._on_anim_finished)
         self._fade_in()
         _active_notifications.append(self)
 
@@ -83,31 +120,7 @@ class NotificationDialog(QDialog):
             title: Notification title.
             body: Notification body text.
         """
-        self.setStyleSheet("""
-            QDialog {
-                background-color: rgba(50, 50, 50, 230);
-                border-radius: 8px;
-            }
-            QLabel#title {
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QLabel#body {
-                color: #cccccc;
-                font-size: 12px;
-            }
-            QPushButton#close {
-                color: #999999;
-                background: transparent;
-                border: none;
-                font-size: 14px;
-                padding: 2px 6px;
-            }
-            QPushButton#close:hover {
-                color: white;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
@@ -130,15 +143,24 @@ class NotificationDialog(QDialog):
         layout.addWidget(body_label)
 
     def _position_on_screen(self) -> None:
-        """Position the dialog at the bottom-right of the primary screen."""
+        """Position the dialog at the bottom-right of the primary screen.
+
+        Notifications stack upwards in slots.  A new dialog takes the lowest
+        free slot, so the gap left by one dismissed out of order is reused
+        rather than the new dialog overlapping the ones still shown.
+        """
+        # Drop dialogs that were closed or destroyed without going through
+        # _dismiss, so they neither hold a slot nor stay referenced forever.
+        _active_notifications[:] = [
+            n for n in _active_notifications if shiboken6.isValid(n) and n.isVisible()
+        ]
+        taken = {n._slot for n in _active_notifications}
+        self._slot = next(slot for slot in range(len(taken) + 1) if slot not in taken)
         screen = QGuiApplication.primaryScreen()
         if not screen:
             return
         geo = screen.availableGeometry()
-        # Filter to only visible notifications to avoid stale entries
-        # affecting the offset calculation.
-        visible = [n for n in _active_notifications if n.isVisible()]
-        offset = len(visible) * (self.height() + 8)
+        offset = self._slot * (self.height() + 8)
         x = geo.right() - self.width() - 16
         y = geo.bottom() - self.height() - 16 - offset
         self.move(x, y)
@@ -147,7 +169,6 @@ class NotificationDialog(QDialog):
         """Animate the dialog fading in."""
         self.setWindowOpacity(0.0)
         self.show()
-        self._anim = QPropertyAnimation(self, b"windowOpacity")
         self._anim.setDuration(200)
         self._anim.setStartValue(0.0)
         self._anim.setEndValue(1.0)
@@ -155,13 +176,18 @@ class NotificationDialog(QDialog):
 
     def _fade_out(self) -> None:
         """Animate the dialog fading out, then close."""
-        self._anim = QPropertyAnimation(self, b"windowOpacity")
+        self._anim.stop()
+        self._fading_out = True
         self._anim.setDuration(300)
         self._anim.setStartValue(1.0)
         self._anim.setEndValue(0.0)
-        self._anim.finished.connect(self._dismiss)
         self._anim.start()
 
+    def _on_anim_finished(self) -> None:
+        """Dismiss the dialog once its fade-out has finished."""
+        if self._fading_out:
+            self._dismiss()
+
     def _dismiss(self) -> None:
         """Close and clean up the notification."""
         self._dismiss_timer.stop()
@@ -202,6 +228,14 @@ class Notifier:
             style: "native" or "custom" notification style.
         """
         self._tray_icon = tray_icon
+        self.set_style(style)
+
+    def set_style(self, style: str) -> None:
+        """Change the notification style.
+
+        Args:
+            style: "native" or "custom" notification style.
+        """
         self._use_custom = style == "custom" or (style == "native" and sys.platform == "win32")
 
     def notify(self, title: str, body: str, icon: QIcon | None = None) -> None:
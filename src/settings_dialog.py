@@ -11,7 +11,6 @@ from typing import TYPE_CHECKING
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QAbstractItemView,
-    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -57,6 +56,8 @@ class SettingsDialog(QDialog):
         """
         super().__init__(parent)
         self.config = config
+        # Working copy of the feed list, kept in step with _feed_list rows
+        self._current_feeds: list[Feed] = []
         self.setWindowTitle("Jinkies — Settings")
         self.setMinimumWidth(500)
         self._setup_ui()
@@ -166,10 +167,28 @@ class SettingsDialog(QDialog):
         self._notif_style.setCurrentText(self.config.notification_style)
 
         self._feed_list.clear()
-        for feed in self.config.feeds:
-            item = QListWidgetItem(f"{feed.name} — {feed.url}")
-            item.setData(Qt.ItemDataRole.UserRole, feed)
-            self._feed_list.addItem(item)
+        self._current_feeds = []
+        self._append_feed_items(self.config.feeds)
+
+    def _append_feed_items(self, feeds: list[Feed]) -> None:
+        """Append feeds to the working list and add an item for each.
+
+        Repaints are suspended while the items are added, because large
+        OPML imports would otherwise schedule a viewport update for every
+        inserted row.
+
+        Args:
+            feeds: The feeds to append, in display order.
+        """
+        self._current_feeds.extend(feeds)
+        self._feed_list.setUpdatesEnabled(False)
+        try:
+            for feed in feeds:
+                item = QListWidgetItem(f"{feed.name} — {feed.url}")
+                item.setData(Qt.ItemDataRole.UserRole, feed)
+                self._feed_list.addItem(item)
+        finally:
+            self._feed_list.setUpdatesEnabled(True)
 
     def _browse_sound(self, event_type: str) -> None:
         """Open a file dialog to select a WAV sound file.
@@ -201,9 +220,7 @@ class SettingsDialog(QDialog):
                 url=url,
                 name=dialog.name_edit.text(),
             )
-            item = QListWidgetItem(f"{feed.name} — {feed.url}")
-            item.setData(Qt.ItemDataRole.UserRole, feed)
-            self._feed_list.addItem(item)
+            self._append_feed_items([feed])
 
     def _edit_feed(self) -> None:
         """Edit the selected feed."""
@@ -243,7 +260,7 @@ class SettingsDialog(QDialog):
             [(self._feed_list.row(item), item) for item in selected_items]
         )
         rows = [row for row, _ in items_with_rows]
-        feeds = [item.data(Qt.ItemDataRole.UserRole) for _, item in items_with_rows]
+        feeds = [self._current_feeds[row] for row in rows]
 
         if len(rows) == 1:
             title = "Remove Feed"
@@ -267,6 +284,7 @@ class SettingsDialog(QDialog):
             delete_credentials(feed.url)
         for row in sorted(rows, reverse=True):
             self._feed_list.takeItem(row)
+            del self._current_feeds[row]
 
     def _import_feeds(self) -> None:
         """Import feeds from an OPML or Atom/XML file with preview."""
@@ -291,21 +309,13 @@ class SettingsDialog(QDialog):
         if not feeds:
             return
 
-        existing_urls = set()
-        for i in range(self._feed_list.count()):
-            item = self._feed_list.item(i)
-            if item:
-                feed = item.data(Qt.ItemDataRole.UserRole)
-                existing_urls.add(feed.url)
+        existing_urls = {f.url for f in self._current_feeds}
 
         preview = ImportPreviewDialog(feeds, existing_urls, parent=self)
         if preview.exec() != QDialog.DialogCode.Accepted:
             return
 
-        for feed in preview.get_feeds():
-            item = QListWidgetItem(f"{feed.name} — {feed.url}")
-            item.setData(Qt.ItemDataRole.UserRole, feed)
-            self._feed_list.addItem(item)
+        self._append_feed_items(preview.get_feeds())
 
     def _save_and_accept(self) -> None:
         """Save settings to config and close."""
@@ -315,12 +325,7 @@ class SettingsDialog(QDialog):
         self.config.sound_map["error"] = self._error_sound.text()
         self.config.notification_style = self._notif_style.currentText()
 
-        self.config.feeds = []
-        for i in range(self._feed_list.count()):
-            item = self._feed_list.item(i)
-            if item:
-                feed = item.data(Qt.ItemDataRole.UserRole)
-                self.config.feeds.append(feed)
+        self.config.feeds = list(self._current_feeds)
 
         self.accept()
 
@@ -427,42 +432,66 @@ class ImportPreviewDialog(QDialog):
         layout.addWidget(buttons)
 
     def _populate_table(self) -> None:
-        """Fill the table with parsed feed data."""
+        """Fill the table with parsed feed data.
+
+        The import column uses checkable items rather than per-row
+        QCheckBox widgets, so a large OPML file creates no child widgets.
+        """
         self._table.setRowCount(len(self._source_feeds))
         dup_count = 0
 
-        for row, feed in enumerate(self._source_feeds):
-            # Checkbox column
-            checkbox = QCheckBox()
-            is_dup = feed.url in self._existing_urls
-            checkbox.setChecked(not is_dup)
-            if is_dup:
-                dup_count += 1
-            self._table.setCellWidget(row, 0, checkbox)
-
-            # Editable name
-            name_item = QTableWidgetItem(feed.name)
-            self._table.setItem(row, 1, name_item)
-
-            # Editable URL
-            url_item = QTableWidgetItem(feed.url)
-            self._table.setItem(row, 2, url_item)
+        self._table.setUpdatesEnabled(False)
+        try:
+            for row, feed in enumerate(self._source_feeds):
+                # Checkbox column
+                is_dup = feed.url in self._existing_urls
+                if is_dup:
+                    dup_count += 1
+                check_item = QTableWidgetItem()
+                check_item.setFlags(
+                    Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+                )
+                check_item.setCheckState(
+                    Qt.CheckState.Unchecked if is_dup else Qt.CheckState.Checked
+                )
+                self._table.setItem(row, 0, check_item)
+
+                # Editable name
+                self._table.setItem(row, 1, QTableWidgetItem(feed.name))
+
+                # Editable URL
+                self._table.setItem(row, 2, QTableWidgetItem(feed.url))
+        finally:
+            self._table.setUpdatesEnabled(True)
 
         if dup_count:
             self._dup_label.setText(
                 f"{dup_count} feed(s) already exist and are unchecked."
             )
 
+    def _is_checked(self, row: int) -> bool:
+        """Return whether the import checkbox for a row is ticked.
+
+        Args:
+            row: The table row to check.
+
+        Returns:
+            True if the feed on that row should be imported.
+        """
+        item = self._table.item(row, 0)
+        return item is not None and item.checkState() == Qt.CheckState.Checked
+
     def _set_all_checked(self, checked: bool) -> None:
         """Set all feed checkboxes to the given state.
 
         Args:
             checked: Whether to check or uncheck all.
         """
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
         for row in range(self._table.rowCount()):
-            cb = self._table.cellWidget(row, 0)
-            if cb:
-                cb.setChecked(checked)
+            item = self._table.item(row, 0)
+            if item:
+                item.setCheckState(state)
 
     def _accept_import(self) -> None:
         """Collect checked feeds with user edits and auth, then accept."""
@@ -471,8 +500,7 @@ class ImportPreviewDialog(QDialog):
 
         self.feeds = []
         for row in range(self._table.rowCount()):
-            checkbox = self._table.cellWidget(row, 0)
-            if not checkbox or not checkbox.isChecked():
+            if not self._is_checked(row):
                 continue
 
             name = self._table.item(row, 1).text().strip()
@@ -483,9 +511,7 @@ class ImportPreviewDialog(QDialog):
             if auth_user and auth_token:
                 store_credentials(url, auth_user, auth_token)
 
-            from src.models import Feed as FeedModel
-
-            self.feeds.append(FeedModel(
+            self.feeds.append(Feed(
                 url=url,
                 name=name or url,
                 auth_user=auth_user,
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 
+from src.credential_store import clear_credential_cache
 from src.models import AppConfig, Feed, FeedEntry
 
 
+@pytest.fixture(autouse=True)
+def _clear_credential_cache():
+    """Keep credential lookups cached by one test from leaking into the next."""
+    clear_credential_cache()
+    yield
+    clear_credential_cache()
+
+
 @pytest.fixture
 def tmp_config_dir(tmp_path):
     """Provide a temporary config directory."""
@@ -58,26 +65,49 @@ def sample_config(sample_feed):
     )
 
 
-@pytest.fixture
-def mock_feedparser_result():
-    """Provide a mock feedparser result with sample entries."""
-    entry1 = MagicMock()
-    entry1.get = lambda key, default="": {
+_MOCK_ENTRY_DATA = (
+    {
         "id": "entry-1",
         "title": "First Entry",
         "link": "https://example.com/1",
         "published": "2024-01-01T00:00:00Z",
-    }.get(key, default)
-
-    entry2 = MagicMock()
-    entry2.get = lambda key, default="": {
+    },
+    {
         "id": "entry-2",
         "title": "Second Entry",
         "link": "https://example.com/2",
         "published": "2024-01-02T00:00:00Z",
-    }.get(key, default)
+    },
+)
+
+
+class _FakeEntry:
+    """Stand-in for a feedparser entry, which is read through ``get``."""
+
+    __slots__ = ("_data",)
 
-    result = MagicMock()
-    result.bozo = False
-    result.entries = [entry1, entry2]
-    return result
+    def __init__(self, data):
+        self._data = data
+
+    def get(self, key, default=""):
+        return self._data.get(key, default)
+
+
+class _FakeResult:
+    """Stand-in for a feedparser result carrying only the fields polled.
+
+    Unlike a MagicMock, it has no ``etag``/``modified`` attributes unless a
+    test sets them, so the poller does not copy mock objects onto the feed
+    under test.
+    """
+
+    def __init__(self, entries):
+        self.bozo = False
+        self.bozo_exception = None
+        self.entries = entries
+
+
+@pytest.fixture
+def mock_feedparser_result():
+    """Provide a mock feedparser result with sample entries."""
+    return _FakeResult([_FakeEntry(data) for data in _MOCK_ENTRY_DATA])
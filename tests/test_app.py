@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.app import JinkiesApp, _get_icon_path
+import src.app as app_module
+from src.app import JinkiesApp, _get_icon_path, _release_lock, _try_lock
 from src.models import AppConfig, Feed, FeedEntry
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _no_seen_log_rotation():
+    """Keep _save_state() from touching the real seen-ID log."""
+    with patch("src.app.rotate_seen_log", return_value=[]):
+        yield
+
+
 def _make_app(icon_path="", state=None, config=None):
     """Return a JinkiesApp with all external dependencies mocked out.
 
@@ -173,11 +182,39 @@ class TestJinkiesAppStartup:
             JinkiesApp()
             mock_load_config.assert_called_once()
 
-    def test_init_starts_poller(self):
-        """FeedPoller.start() is called during construction."""
+    def test_init_builds_dashboard_with_configured_cap(self):
+        """The dashboard loads its store under the configured max_entries."""
+        with (
+            patch("src.app.load_config", return_value=AppConfig(max_entries=250)),
+            patch("src.app.load_state", return_value={}),
+            patch("src.app.save_state"),
+            patch("src.app.ensure_default_sounds"),
+            patch("src.app.QApplication"),
+            patch("src.app.QSystemTrayIcon"),
+            patch("src.app.AudioPlayer"),
+            patch("src.app.Notifier"),
+            patch("src.app.Dashboard") as mock_dashboard,
+            patch("src.app.FeedPoller"),
+            patch("src.app._get_icon_path", return_value=""),
+        ):
+            JinkiesApp()
+            mock_dashboard.assert_called_once_with(max_entries=250)
+
+    def test_init_defers_poller_start(self, qtbot):
+        """FeedPoller.start() runs from the event loop, not during construction."""
         app, *_ = _make_app()
+        app.poller.start.assert_not_called()
+        qtbot.waitUntil(lambda: app.poller.start.called)
         app.poller.start.assert_called_once()
 
+    def test_init_defers_audio_preparation(self, qtbot):
+        """Default sounds are generated and preloaded from the event loop."""
+        with patch("src.app.ensure_default_sounds") as mock_ensure:
+            app, audio, *_ = _make_app()
+            mock_ensure.assert_not_called()
+            qtbot.waitUntil(lambda: audio.preload.called)
+        mock_ensure.assert_called_once()
+
     def test_run_shows_dashboard_and_executes_app(self):
         """run() shows the dashboard and calls app.exec()."""
         app, _, _, dashboard = _make_app()
@@ -206,6 +243,14 @@ class TestJinkiesAppStartup:
         app, *_ = _make_app(icon_path="/fake/icon.png")
         app._tray.setIcon.assert_called()
 
+    def test_init_decodes_icon_once(self):
+        """The window and tray share a single QIcon instance."""
+        with patch("src.app.QIcon") as mock_icon:
+            app, *_ = _make_app(icon_path="/fake/icon.png")
+        mock_icon.assert_called_once_with("/fake/icon.png")
+        app.app.setWindowIcon.assert_called_once_with(mock_icon.return_value)
+        app._tray.setIcon.assert_called_once_with(mock_icon.return_value)
+
 
 class TestJinkiesAppQuit:
     """_quit() saves state and stops the poller cleanly."""
@@ -217,6 +262,27 @@ class TestJinkiesAppQuit:
             app._quit()
         mock_save.assert_called()
 
+    def test_quit_flushes_entry_store(self):
+        """_quit() writes coalesced dashboard store changes."""
+        app, *_ = _make_app()
+        with patch("src.app.save_state"):
+            app._quit()
+        app.dashboard.flush_entries_store.assert_called_once()
+
+    def test_quit_saves_changed_feed_validators(self):
+        """ETags learned while polling are written to the config on quit."""
+        app, *_ = _make_app()
+        app.config.feeds[0].etag = '"abc"'
+        with patch("src.app.save_state"), patch("src.app.save_config") as mock_save_config:
+            app._quit()
+        mock_save_config.assert_called_once_with(app.config)
+
+    def test_quit_skips_config_save_when_validators_unchanged(self):
+        app, *_ = _make_app()
+        with patch("src.app.save_state"), patch("src.app.save_config") as mock_save_config:
+            app._quit()
+        mock_save_config.assert_not_called()
+
     def test_quit_stops_poller(self):
         """_quit() requests poller interruption and waits."""
         app, *_ = _make_app()
@@ -312,6 +378,7 @@ class TestOnNewEntries:
 
         with patch("src.app.save_state"):
             app._on_new_entries([entry])
+        app._announce_new_entries()
 
         audio.play.assert_called_once_with("new_entry", sound_file=None)
         args = notifier.notify.call_args[0]
@@ -324,11 +391,56 @@ class TestOnNewEntries:
 
         with patch("src.app.save_state"):
             app._on_new_entries(entries)
+        app._announce_new_entries()
 
         audio.play.assert_called_once_with("new_entry", sound_file=None)
         args = notifier.notify.call_args[0]
         assert "2" in args[1]
 
+    def test_single_feed_burst_names_the_feed(self):
+        """A burst from one feed names that feed like a single entry would."""
+        app, _, notifier, _ = _make_app()
+        entries = [self._make_entry("e1"), self._make_entry("e2")]
+
+        with patch("src.app.save_state"):
+            app._on_new_entries(entries)
+        app._announce_new_entries()
+
+        assert notifier.notify.call_args[0][1] == (
+            "2 new entries\nFrom: https://example.com/feed"
+        )
+
+    def test_multi_feed_burst_counts_feeds(self):
+        """A burst spanning feeds reports how many feeds it came from."""
+        app, _, notifier, _ = _make_app()
+        entries = [
+            self._make_entry("e1"),
+            self._make_entry("e2", feed_url="https://other.example.com/feed"),
+        ]
+
+        with patch("src.app.save_state"):
+            app._on_new_entries(entries)
+        app._announce_new_entries()
+
+        assert notifier.notify.call_args[0][1] == "2 new entries\nFrom 2 feed(s)"
+
+    def test_batches_within_window_share_one_notification(self, qtbot):
+        """Batches from feeds finishing together produce one sound and popup."""
+        app, audio, notifier, _ = _make_app()
+
+        with patch("src.app.save_state"):
+            app._on_new_entries([self._make_entry("e1")])
+            app._on_new_entries(
+                [self._make_entry("e2", feed_url="https://other.example.com/feed")]
+            )
+            notifier.notify.assert_not_called()
+            qtbot.waitUntil(lambda: notifier.notify.called)
+
+        audio.play.assert_called_once_with("new_entry", sound_file=None)
+        notifier.notify.assert_called_once_with(
+            "Jinkies!", "2 new entries\nFrom 2 feed(s)"
+        )
+
     def test_adds_entries_to_dashboard(self):
         """New entries are forwarded to the dashboard."""
         app, _, _, dashboard = _make_app()
@@ -487,6 +599,92 @@ class TestApplyConfigChanges:
                 app._apply_config_changes()
         assert audio.sound_map == {"new_entry": "beep.wav"}
 
+    def test_updates_notifier_style_in_place(self):
+        """The existing Notifier is restyled rather than replaced."""
+        app, _, notifier, _ = _make_app()
+        app.config.notification_style = "custom"
+        with patch("src.app.save_config"):
+            app._apply_config_changes()
+        assert app.notifier is notifier
+        notifier.set_style.assert_called_once_with("custom")
+
+
+class TestScheduledStateSave:
+    """New entries schedule a coalesced state write instead of writing at once."""
+
+    def _make_entry(self, entry_id="e1"):
+        return FeedEntry(
+            feed_url="https://example.com/feed",
+            title="New post",
+            link="https://example.com/1",
+            published="2024-01-01T00:00:00Z",
+            entry_id=entry_id,
+            seen=False,
+        )
+
+    def test_new_entries_defer_write(self):
+        """_on_new_entries() starts the save timer rather than writing."""
+        app, *_ = _make_app()
+        with patch("src.app.save_state") as mock_save:
+            app._on_new_entries([self._make_entry("e1")])
+            app._on_new_entries([self._make_entry("e2")])
+        mock_save.assert_not_called()
+        assert app._state_save_timer.isActive()
+
+    def test_batch_records_ids_and_clears_feed_error_once(self):
+        """A multi-entry batch records every ID and clears its feed's error once."""
+        app, _, _, dashboard = _make_app()
+        app._on_new_entries([self._make_entry(f"e{i}") for i in range(3)])
+        assert {"e0", "e1", "e2"} <= app._seen_ids
+        assert app._unsaved_seen_ids.keys() == {"e0", "e1", "e2"}
+        dashboard.clear_feed_error.assert_called_once_with("https://example.com/feed")
+
+    def test_timer_timeout_appends_once(self):
+        """When the timer fires, all pending IDs are appended in one write."""
+        app, *_ = _make_app()
+        with (
+            patch("src.app.save_state") as mock_save,
+            patch("src.app.append_seen_ids", return_value=100) as mock_append,
+        ):
+            app._on_new_entries([self._make_entry("e1")])
+            app._on_new_entries([self._make_entry("e2")])
+            app._state_save_timer.timeout.emit()
+        mock_append.assert_called_once()
+        assert mock_append.call_args[0][0].keys() == {"e1", "e2"}
+        mock_save.assert_not_called()
+
+    def test_already_seen_ids_not_reappended(self):
+        """IDs that already have a timestamp are not written to the log again."""
+        app, *_ = _make_app(state={"seen_ids": {"e1": "2024-01-01T00:00:00+00:00"}})
+        with patch("src.app.append_seen_ids", return_value=100) as mock_append:
+            app._on_new_entries([self._make_entry("e1")])
+            app._state_save_timer.timeout.emit()
+        mock_append.assert_not_called()
+
+    def test_large_log_triggers_snapshot(self):
+        """A log past the compaction threshold is folded into a full snapshot."""
+        from src.config import SEEN_LOG_COMPACT_BYTES
+
+        app, *_ = _make_app()
+        with (
+            patch("src.app.save_state") as mock_save,
+            patch("src.app.append_seen_ids", return_value=SEEN_LOG_COMPACT_BYTES + 1),
+        ):
+            app._on_new_entries([self._make_entry("e1")])
+            app._state_save_timer.timeout.emit()
+            app._state_writer.waitForDone()
+        mock_save.assert_called_once()
+        assert "e1" in mock_save.call_args[0][0]["seen_ids"]
+
+    def test_quit_flushes_pending_write(self):
+        """_quit() writes pending state immediately and cancels the timer."""
+        app, *_ = _make_app()
+        with patch("src.app.save_state") as mock_save:
+            app._on_new_entries([self._make_entry("e1")])
+            app._quit()
+        mock_save.assert_called_once()
+        assert not app._state_save_timer.isActive()
+
 
 class TestSaveState:
     """_save_state() persists seen IDs and prunes stale ones."""
@@ -497,10 +695,27 @@ class TestSaveState:
         app._seen_ids.add("id-1")
         with patch("src.app.save_state") as mock_save:
             app._save_state()
+            app._state_writer.waitForDone()
         mock_save.assert_called_once()
         saved_state = mock_save.call_args[0][0]
         assert "id-1" in saved_state["seen_ids"]
 
+    def test_writes_snapshot_on_writer_thread(self):
+        """The write gets a copy of the seen IDs and the rotated logs."""
+        app, *_ = _make_app()
+        app._seen_ids_timestamps["id-1"] = "2099-01-01T00:00:00+00:00"
+        rotated = [Path("seen_ids.log.1")]
+        with (
+            patch("src.app.rotate_seen_log", return_value=rotated),
+            patch("src.app.save_state") as mock_save,
+        ):
+            app._save_state()
+            app._seen_ids_timestamps["id-2"] = "2099-01-01T00:00:00+00:00"
+            app._state_writer.waitForDone()
+        snapshot = mock_save.call_args[0][0]
+        assert set(snapshot["seen_ids"]) == {"id-1"}
+        assert mock_save.call_args.kwargs == {"seen_logs": rotated}
+
     def test_prunes_stale_ids(self):
         """IDs older than max_age_days are removed."""
         import datetime
@@ -514,6 +729,7 @@ class TestSaveState:
 
         with patch("src.app.save_state") as mock_save:
             app._save_state()
+            app._state_writer.waitForDone()
 
         saved = mock_save.call_args[0][0]["seen_ids"]
         assert "old-id" not in saved
@@ -526,6 +742,7 @@ class TestSaveState:
 
         with patch("src.app.save_state") as mock_save:
             app._save_state()
+            app._state_writer.waitForDone()
 
         saved = mock_save.call_args[0][0]["seen_ids"]
         assert "bad-ts-id" not in saved
@@ -544,6 +761,7 @@ class TestSaveState:
 
         with patch("src.app.save_state") as mock_save:
             app._save_state()
+            app._state_writer.waitForDone()
 
         saved = mock_save.call_args[0][0]["seen_ids"]
         assert "naive-id" in saved
@@ -613,6 +831,26 @@ class TestOnRemoveFeed:
 
         assert len(app.config.feeds) == 0
 
+    def test_removal_updates_rows_in_place(self):
+        """Removal drops dashboard rows directly instead of rebuilding the list."""
+        from PySide6.QtWidgets import QMessageBox
+        app, _, _, dashboard = _make_app()
+        dashboard.update_feeds.reset_mock()
+
+        with (
+            patch(
+                "src.app.QMessageBox.question",
+                return_value=QMessageBox.StandardButton.Yes,
+            ),
+            patch("src.app.save_config") as mock_save,
+        ):
+            app._on_remove_feed([0])
+
+        mock_save.assert_called_once_with(app.config)
+        dashboard.remove_feeds.assert_called_once_with([0])
+        dashboard.update_feeds.assert_not_called()
+        app.poller.update_feeds.assert_called_once_with([])
+
     def test_cancelled_single_removal(self):
         """Cancelling the removal confirmation leaves config unchanged."""
         from PySide6.QtWidgets import QMessageBox
@@ -900,6 +1138,77 @@ class TestGetIconPath:
         assert result == str(png)
 
 
+class TestInstanceLock:
+    """_try_lock/_release_lock enforce a single running instance."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_lock(self, tmp_path):
+        yield
+        _release_lock(tmp_path)
+
+    def test_second_lock_fails_while_held(self, tmp_path):
+        """A second lock attempt fails until the first is released."""
+        assert _try_lock(tmp_path)
+        held = app_module._lock_fh
+        app_module._lock_fh = None
+        try:
+            assert not _try_lock(tmp_path)
+        finally:
+            app_module._lock_fh = held
+
+    def test_release_allows_relock(self, tmp_path):
+        """Releasing removes the lock file and lets a new instance lock."""
+        assert _try_lock(tmp_path)
+        _release_lock(tmp_path)
+        assert not (tmp_path / ".lock").exists()
+        assert _try_lock(tmp_path)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX unlink ordering")
+    def test_release_unlinks_while_still_locked(self, tmp_path):
+        """The lock file is unlinked before the lock handle is closed."""
+        assert _try_lock(tmp_path)
+        held = app_module._lock_fh
+        closed_at_unlink = []
+        real_unlink = Path.unlink
+
+        def recording_unlink(path, missing_ok=False):
+            closed_at_unlink.append(held.closed)
+            real_unlink(path, missing_ok=missing_ok)
+
+        with patch.object(Path, "unlink", autospec=True, side_effect=recording_unlink):
+            _release_lock(tmp_path)
+        assert closed_at_unlink == [False]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX unlink ordering")
+    def test_open_before_unlink_does_not_allow_two_holders(self, tmp_path):
+        """An instance that opened the old file just before release can't lock it too.
+
+        Instance A holds the lock.  B opens the lock file, then A releases it
+        (unlinking the path) and C locks a freshly created file, all before B
+        calls flock.  B must not end up holding the orphaned inode alongside C.
+        """
+        assert _try_lock(tmp_path)
+        holders = {}
+        real_open = Path.open
+
+        def interleaved_open(path, *args, **kwargs):
+            fh = real_open(path, *args, **kwargs)
+            if "c" not in holders:
+                holders["c"] = None
+                _release_lock(tmp_path)  # A exits
+                assert _try_lock(tmp_path)  # C starts
+                holders["c"] = app_module._lock_fh
+                app_module._lock_fh = None
+            return fh
+
+        with patch.object(Path, "open", autospec=True, side_effect=interleaved_open):
+            acquired = _try_lock(tmp_path)  # B
+        try:
+            assert not acquired
+        finally:
+            holders["c"].close()
+
+
 # ---------------------------------------------------------------------------
 # Module-level run()
 # ---------------------------------------------------------------------------
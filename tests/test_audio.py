@@ -4,9 +4,16 @@ from __future__ import annotations
 
 import sys
 import wave
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from src.audio import AudioPlayer, ensure_default_sounds, generate_wav, get_sounds_dir
+from src.audio import (
+    GENERATED_MARKER,
+    AudioPlayer,
+    ensure_default_sounds,
+    generate_wav,
+    get_sounds_dir,
+)
 
 
 class TestGetSoundsDir:
@@ -42,6 +49,16 @@ class TestGenerateWav:
         generate_wav(path, frequency=220.0, duration=0.05)
         assert path.exists()
 
+    def test_identical_tones_reuse_synthesis(self, tmp_path):
+        """Generating the same tone twice should synthesize it only once."""
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        generate_wav(first, frequency=330.0, duration=0.05)
+        with patch("src.audio.math.sin") as mock_sin:
+            generate_wav(second, frequency=330.0, duration=0.05)
+        mock_sin.assert_not_called()
+        assert first.read_bytes() == second.read_bytes()
+
 
 class TestEnsureDefaultSounds:
     def test_creates_default_sounds(self, tmp_sounds_dir):
@@ -55,6 +72,23 @@ class TestEnsureDefaultSounds:
         ensure_default_sounds(tmp_sounds_dir)
         assert existing.read_text() == "existing content"
 
+    def test_writes_marker_after_generating(self, tmp_sounds_dir):
+        ensure_default_sounds(tmp_sounds_dir)
+        assert (tmp_sounds_dir / GENERATED_MARKER).exists()
+
+    def test_no_marker_when_sounds_already_present(self, tmp_sounds_dir):
+        """Shipped sounds should not cause a marker to be written."""
+        (tmp_sounds_dir / "new_entry.wav").write_text("x")
+        (tmp_sounds_dir / "error.wav").write_text("x")
+        ensure_default_sounds(tmp_sounds_dir)
+        assert not (tmp_sounds_dir / GENERATED_MARKER).exists()
+
+    def test_marker_skips_file_checks(self, tmp_sounds_dir):
+        (tmp_sounds_dir / GENERATED_MARKER).touch()
+        with patch("src.audio.generate_wav") as mock_generate:
+            ensure_default_sounds(tmp_sounds_dir)
+        mock_generate.assert_not_called()
+
 
 class TestAudioPlayer:
     def test_init(self, tmp_sounds_dir):
@@ -111,10 +145,41 @@ class TestAudioPlayer:
         player = AudioPlayer({"beep": "beep.wav"}, sounds_dir=tmp_sounds_dir)
 
         mock_effect = MagicMock()
-        with patch("src.audio.QSoundEffect", return_value=mock_effect):
+        with patch("PySide6.QtMultimedia.QSoundEffect", return_value=mock_effect):
             player.play("beep")
             player.play("beep")  # second call uses the cached effect
 
         # QSoundEffect constructor called once (cached on second call)
         assert mock_effect.setSource.call_count == 1
         assert mock_effect.play.call_count == 2
+
+    def test_cached_effect_skips_filesystem_check(self, tmp_sounds_dir):
+        """Replaying a cached effect does not stat the WAV file again."""
+        generate_wav(tmp_sounds_dir / "beep.wav", frequency=440.0, duration=0.05)
+        player = AudioPlayer({"beep": "beep.wav"}, sounds_dir=tmp_sounds_dir)
+
+        mock_effect = MagicMock()
+        with patch("PySide6.QtMultimedia.QSoundEffect", return_value=mock_effect):
+            player.play("beep")
+            with patch.object(Path, "exists") as mock_exists:
+                player.play("beep")
+
+        mock_exists.assert_not_called()
+        assert mock_effect.play.call_count == 2
+
+    def test_preload_loads_every_mapped_sound(self, tmp_sounds_dir):
+        """preload() creates effects up front so play() only has to play."""
+        generate_wav(tmp_sounds_dir / "a.wav", frequency=440.0, duration=0.05)
+        generate_wav(tmp_sounds_dir / "b.wav", frequency=880.0, duration=0.05)
+        player = AudioPlayer(
+            {"a": "a.wav", "b": "b.wav", "missing": "missing.wav", "empty": ""},
+            sounds_dir=tmp_sounds_dir,
+        )
+
+        with patch("PySide6.QtMultimedia.QSoundEffect") as mock_cls:
+            player.preload()
+            assert set(player._effects) == {"a", "b"}
+            assert mock_cls.call_count == 2
+            player.play("a")
+            assert mock_cls.call_count == 2
+        player._effects["a"].play.assert_called_once()
@@ -4,14 +4,24 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from src.config import get_config_dir, load_config, load_state, save_config, save_state
-from src.models import AppConfig
+from src.config import (
+    SEEN_LOG_NAME,
+    append_seen_ids,
+    get_config_dir,
+    load_config,
+    load_state,
+    prune_seen_ids,
+    rotate_seen_log,
+    save_config,
+    save_state,
+)
+from src.models import AppConfig, Feed
 
 _FAKE_HOME = Path("/fake/home")
 
@@ -19,6 +29,12 @@ _FAKE_HOME = Path("/fake/home")
 class TestGetConfigDir:
     """Tests for platform-specific path construction in get_config_dir."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        get_config_dir.cache_clear()
+        yield
+        get_config_dir.cache_clear()
+
     @pytest.mark.parametrize(
         ("platform", "expected"),
         [
@@ -44,6 +60,14 @@ class TestGetConfigDir:
         ):
             get_config_dir()
 
+    def test_result_is_cached(self):
+        """Repeated calls return the same Path without recomputing it."""
+        with patch("src.config.Path.home", return_value=_FAKE_HOME) as mock_home:
+            first = get_config_dir()
+            second = get_config_dir()
+        assert first is second
+        mock_home.assert_called_once()
+
 
 class TestConfig:
     def test_corrupted_config_json_returns_defaults(self, tmp_config_dir, caplog):
@@ -68,6 +92,29 @@ class TestConfig:
         assert len(loaded.feeds) == 1
         assert loaded.feeds[0].url == "https://example.com/feed.atom"
 
+    def test_config_file_round_trips_byte_identical(self, tmp_config_dir):
+        """Loading and re-saving a config must not change the file."""
+        config = AppConfig(
+            poll_interval_secs=90,
+            feeds=[
+                Feed(url="https://a.com/feed", name="Café", etag='"abc"'),
+                Feed(
+                    url="https://b.com/feed", name="B", enabled=False,
+                    sound_file="b.wav", last_poll_time="2024-01-01T00:00:00+00:00",
+                    modified="Mon, 01 Jan 2024 00:00:00 GMT",
+                ),
+            ],
+            notification_style="custom",
+            max_entries=500,
+            page_size=50,
+        )
+        save_config(config, tmp_config_dir)
+        original = (tmp_config_dir / "config.json").read_bytes()
+
+        save_config(load_config(tmp_config_dir), tmp_config_dir)
+
+        assert (tmp_config_dir / "config.json").read_bytes() == original
+
     def test_config_json_readable(self, tmp_config_dir, sample_config):
         save_config(sample_config, tmp_config_dir)
         with open(tmp_config_dir / "config.json") as f:
@@ -261,20 +308,204 @@ class TestState:
         assert "naive-id" in loaded["seen_ids"]
 
 
+class TestSeenIdLog:
+    """Newly seen IDs are appended to a log and folded in by snapshots."""
+
+    def test_load_state_merges_log(self, tmp_config_dir):
+        now_iso = datetime.now(UTC).isoformat()
+        save_state({"seen_ids": {"id1": now_iso}}, tmp_config_dir)
+        append_seen_ids({"id2": now_iso}, tmp_config_dir)
+        append_seen_ids({"id3": now_iso}, tmp_config_dir)
+        loaded = load_state(tmp_config_dir)
+        assert set(loaded["seen_ids"]) == {"id1", "id2", "id3"}
+
+    def test_log_without_snapshot(self, tmp_config_dir):
+        now_iso = datetime.now(UTC).isoformat()
+        append_seen_ids({"id1": now_iso}, tmp_config_dir)
+        assert set(load_state(tmp_config_dir)["seen_ids"]) == {"id1"}
+
+    def test_snapshot_timestamp_wins_over_log(self, tmp_config_dir):
+        """An ID in both places keeps its original first-seen timestamp."""
+        first = (datetime.now(UTC) - timedelta(days=2)).isoformat()
+        later = datetime.now(UTC).isoformat()
+        save_state({"seen_ids": {"id1": first}}, tmp_config_dir)
+        append_seen_ids({"id1": later}, tmp_config_dir)
+        assert load_state(tmp_config_dir)["seen_ids"]["id1"] == first
+
+    def test_log_entries_are_pruned(self, tmp_config_dir):
+        old_ts = (datetime.now(UTC) - timedelta(days=40)).isoformat()
+        append_seen_ids({"old-id": old_ts}, tmp_config_dir)
+        assert load_state(tmp_config_dir, max_age_days=30)["seen_ids"] == {}
+
+    def test_append_returns_log_size(self, tmp_config_dir):
+        now_iso = datetime.now(UTC).isoformat()
+        size = append_seen_ids({"id1": now_iso}, tmp_config_dir)
+        assert size == (tmp_config_dir / SEEN_LOG_NAME).stat().st_size
+        assert append_seen_ids({"id2": now_iso}, tmp_config_dir) > size
+
+    def test_save_state_removes_log(self, tmp_config_dir):
+        now_iso = datetime.now(UTC).isoformat()
+        append_seen_ids({"id1": now_iso}, tmp_config_dir)
+        save_state({"seen_ids": {"id1": now_iso}}, tmp_config_dir)
+        assert not (tmp_config_dir / SEEN_LOG_NAME).exists()
+        assert set(load_state(tmp_config_dir)["seen_ids"]) == {"id1"}
+
+    def test_malformed_log_line_skipped(self, tmp_config_dir):
+        """A truncated final line (e.g. after a crash) is ignored."""
+        now_iso = datetime.now(UTC).isoformat()
+        append_seen_ids({"id1": now_iso}, tmp_config_dir)
+        with open(tmp_config_dir / SEEN_LOG_NAME, "a", encoding="utf-8") as f:
+            f.write('["id2", "20')
+        assert set(load_state(tmp_config_dir)["seen_ids"]) == {"id1"}
+
+    def test_rotated_snapshot_keeps_later_appends(self, tmp_config_dir):
+        """IDs appended after rotation survive the snapshot that rotated."""
+        now_iso = datetime.now(UTC).isoformat()
+        append_seen_ids({"id1": now_iso}, tmp_config_dir)
+        seen_logs = rotate_seen_log(tmp_config_dir)
+        assert len(seen_logs) == 1
+        append_seen_ids({"id2": now_iso}, tmp_config_dir)
+
+        # Until the snapshot is written, both logs are loaded.
+        assert set(load_state(tmp_config_dir)["seen_ids"]) == {"id1", "id2"}
+
+        save_state({"seen_ids": {"id1": now_iso}}, tmp_config_dir, seen_logs=seen_logs)
+        assert not seen_logs[0].exists()
+        assert (tmp_config_dir / SEEN_LOG_NAME).exists()
+        assert set(load_state(tmp_config_dir)["seen_ids"]) == {"id1", "id2"}
+
+    def test_rotate_returns_unwritten_earlier_rotations(self, tmp_config_dir):
+        """A rotation left behind by an unwritten snapshot is covered next time."""
+        now_iso = datetime.now(UTC).isoformat()
+        append_seen_ids({"id1": now_iso}, tmp_config_dir)
+        first = rotate_seen_log(tmp_config_dir)
+        append_seen_ids({"id2": now_iso}, tmp_config_dir)
+        second = rotate_seen_log(tmp_config_dir)
+        assert second[0] == first[0]
+        assert len(second) == 2
+
+        save_state({"seen_ids": {}}, tmp_config_dir)
+        assert list(tmp_config_dir.glob(f"{SEEN_LOG_NAME}*")) == []
+
+
 class TestWriteJsonFailure:
-    """Tests for _write_json atomic-write failure handling."""
+    """Tests for write_json atomic-write failure handling."""
 
     def test_write_json_cleans_up_tmp_on_failure(self, tmp_config_dir):
         """If an error occurs during write, the temp file is removed."""
-        from src.config import _write_json
+        from src.config import write_json
 
         target = tmp_config_dir / "test.json"
 
         # Patch os.replace to simulate a failure after the temp file is written
         with patch("src.config.os.replace", side_effect=OSError("disk full")):
             with pytest.raises(OSError, match="disk full"):
-                _write_json(target, {"key": "value"})
+                write_json(target, {"key": "value"})
 
         # No leftover .tmp files should remain
         leftover = list(tmp_config_dir.glob("*.tmp"))
         assert leftover == []
+
+
+class TestWriteDurability:
+    """Config writes are fsynced; frequent state writes are not."""
+
+    def test_save_config_fsyncs(self, tmp_config_dir):
+        with patch("src.config.os.fsync") as mock_fsync:
+            save_config(AppConfig(), tmp_config_dir)
+        mock_fsync.assert_called_once()
+
+    def test_save_state_skips_fsync(self, tmp_config_dir):
+        with patch("src.config.os.fsync") as mock_fsync:
+            save_state({"seen_ids": {}}, tmp_config_dir)
+        mock_fsync.assert_not_called()
+        assert (tmp_config_dir / "state.json").exists()
+
+
+class TestWriteFormat:
+    """config.json stays human-readable; state.json is written compactly."""
+
+    def test_config_is_indented(self, tmp_config_dir):
+        save_config(AppConfig(), tmp_config_dir)
+        assert "\n  " in (tmp_config_dir / "config.json").read_text(encoding="utf-8")
+
+    def test_state_is_compact(self, tmp_config_dir):
+        save_state({"seen_ids": {"id1": "2024-01-01T00:00:00+00:00"}}, tmp_config_dir)
+        text = (tmp_config_dir / "state.json").read_text(encoding="utf-8")
+        assert text == '{"seen_ids":{"id1":"2024-01-01T00:00:00+00:00"}}'
+
+
+class TestJsonBackends:
+    """Files round-trip identically with and without the optional orjson."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+            yield
+        else:
+            with patch("src.config.orjson", None):
+                yield
+
+    def test_state_round_trip(self, backend, tmp_config_dir):
+        now_iso = datetime.now(UTC).isoformat()
+        state = {"seen_ids": {"id-é": now_iso}, "tray_tip_shown": True}
+        save_state(state, tmp_config_dir)
+        text = (tmp_config_dir / "state.json").read_text(encoding="utf-8")
+        assert text == json.dumps(state, separators=(",", ":"), ensure_ascii=False)
+        assert load_state(tmp_config_dir) == state
+
+    def test_config_matches_stdlib_indent(self, backend, tmp_config_dir, sample_config):
+        sample_config.feeds[0].name = "Caf\u00e9"
+        sample_config.sound_map = {}
+        save_config(sample_config, tmp_config_dir)
+        text = (tmp_config_dir / "config.json").read_text(encoding="utf-8")
+        assert text == json.dumps(sample_config.to_dict(), indent=2, ensure_ascii=False)
+
+    def test_seen_log_round_trip(self, backend, tmp_config_dir):
+        now_iso = datetime.now(UTC).isoformat()
+        append_seen_ids({"id-\u00e9": now_iso}, tmp_config_dir)
+        with open(tmp_config_dir / SEEN_LOG_NAME, "a", encoding="utf-8") as f:
+            f.write('"not a pair"\n["id2", "20')
+        text = (tmp_config_dir / SEEN_LOG_NAME).read_text(encoding="utf-8")
+        assert text.startswith(f'["id-\u00e9","{now_iso}"]\n')
+        assert load_state(tmp_config_dir)["seen_ids"] == {"id-\u00e9": now_iso}
+
+    def test_corrupted_state_returns_defaults(self, backend, tmp_config_dir):
+        (tmp_config_dir / "state.json").write_text("{not json", encoding="utf-8")
+        assert load_state(tmp_config_dir)["seen_ids"] == {}
+
+    def test_empty_state_returns_defaults(self, backend, tmp_config_dir):
+        (tmp_config_dir / "state.json").write_bytes(b"")
+        assert load_state(tmp_config_dir)["seen_ids"] == {}
+
+
+class TestPruneSeenIds:
+    """prune_seen_ids keeps recent IDs whatever form their timestamp takes."""
+
+    def test_canonical_and_other_timestamp_forms(self):
+        now = datetime.now(UTC)
+        recent = now - timedelta(days=1)
+        stale = now - timedelta(days=40)
+        seen = {
+            "recent-us": recent.isoformat(),
+            "recent-s": recent.replace(microsecond=0).isoformat(),
+            "recent-naive": recent.replace(tzinfo=None).isoformat(),
+            "recent-offset": recent.astimezone(timezone(timedelta(hours=2))).isoformat(),
+            "stale-us": stale.isoformat(),
+            "stale-s": stale.replace(microsecond=0).isoformat(),
+            "stale-naive": stale.replace(tzinfo=None).isoformat(),
+            "invalid": "not-a-timestamp",
+            "not-str": 12345,
+        }
+        pruned = prune_seen_ids(seen, max_age_days=30)
+        assert set(pruned) == {"recent-us", "recent-s", "recent-naive", "recent-offset"}
+
+    def test_cutoff_boundary_within_same_second(self):
+        """String comparison orders fractional and whole seconds correctly."""
+        base = (datetime.now(UTC) - timedelta(days=30)).replace(microsecond=0)
+        seen = {
+            "before": (base - timedelta(seconds=1)).isoformat(),
+            "after": (base + timedelta(seconds=1, microseconds=500)).isoformat(),
+        }
+        assert set(prune_seen_ids(seen, max_age_days=30)) == {"after"}
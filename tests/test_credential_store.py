@@ -2,35 +2,54 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import json
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
+from keyring.errors import PasswordDeleteError
 
+import src.credential_store
 from src.credential_store import (
     _service_name,
+    clear_credential_cache,
     delete_credentials,
     get_credentials,
     store_credentials,
 )
 
 
+@pytest.fixture
+def mock_keyring():
+    """Stand in for the keyring module, which credential_store imports lazily."""
+    mock = MagicMock()
+    mock.errors.PasswordDeleteError = PasswordDeleteError
+    with patch.dict(sys.modules, {"keyring": mock}):
+        yield mock
+
+
+def test_import_does_not_load_keyring(monkeypatch):
+    """keyring is only imported once credentials are actually accessed."""
+    import importlib
+
+    monkeypatch.delitem(sys.modules, "keyring", raising=False)
+    importlib.reload(src.credential_store)
+    assert "keyring" not in sys.modules
+
+
 class TestServiceName:
     def test_service_name_format(self):
         assert _service_name("https://example.com/feed") == "jinkies:https://example.com/feed"
 
 
 class TestStoreCredentials:
-    @patch("src.credential_store.keyring")
     def test_store_credentials_https(self, mock_keyring):
         store_credentials("https://example.com/feed", "user", "token123")
 
-        assert mock_keyring.set_password.call_count == 2
-        mock_keyring.set_password.assert_any_call(
-            "jinkies:https://example.com/feed", "username", "user",
-        )
-        mock_keyring.set_password.assert_any_call(
-            "jinkies:https://example.com/feed", "token", "token123",
-        )
+        mock_keyring.set_password.assert_called_once()
+        service, key, payload = mock_keyring.set_password.call_args.args
+        assert (service, key) == ("jinkies:https://example.com/feed", "credentials")
+        assert json.loads(payload) == {"u": "user", "t": "token123"}
 
     def test_store_credentials_http_rejected(self):
         with pytest.raises(ValueError, match="non-HTTPS"):
@@ -42,8 +61,26 @@ class TestStoreCredentials:
 
 
 class TestGetCredentials:
-    @patch("src.credential_store.keyring")
-    def test_get_existing_credentials(self, mock_keyring):
+    def test_get_combined_credentials_single_lookup(self, mock_keyring):
+        mock_keyring.get_password.return_value = json.dumps({"u": "user", "t": "token123"})
+
+        result = get_credentials("https://example.com/feed")
+        assert result == ("user", "token123")
+        mock_keyring.get_password.assert_called_once_with(
+            "jinkies:https://example.com/feed", "credentials",
+        )
+
+    def test_get_malformed_combined_entry_falls_back(self, mock_keyring):
+        mock_keyring.get_password.side_effect = lambda svc, key: {
+            "credentials": "not json",
+            "username": "user",
+            "token": "token123",
+        }.get(key)
+
+        result = get_credentials("https://example.com/feed")
+        assert result == ("user", "token123")
+
+    def test_get_legacy_credentials(self, mock_keyring):
         mock_keyring.get_password.side_effect = lambda svc, key: {
             ("jinkies:https://example.com/feed", "username"): "user",
             ("jinkies:https://example.com/feed", "token"): "token123",
@@ -52,14 +89,12 @@ class TestGetCredentials:
         result = get_credentials("https://example.com/feed")
         assert result == ("user", "token123")
 
-    @patch("src.credential_store.keyring")
     def test_get_missing_credentials(self, mock_keyring):
         mock_keyring.get_password.return_value = None
 
         result = get_credentials("https://example.com/feed")
         assert result is None
 
-    @patch("src.credential_store.keyring")
     def test_get_partial_credentials_returns_none(self, mock_keyring):
         mock_keyring.get_password.side_effect = lambda svc, key: {
             ("jinkies:https://example.com/feed", "username"): "user",
@@ -69,13 +104,41 @@ class TestGetCredentials:
         result = get_credentials("https://example.com/feed")
         assert result is None
 
+    def test_get_cached_until_stored_or_deleted(self, mock_keyring):
+        url = "https://example.com/feed"
+        mock_keyring.get_password.return_value = json.dumps({"u": "user", "t": "old"})
+        assert get_credentials(url) == ("user", "old")
+        assert get_credentials(url) == ("user", "old")
+        assert mock_keyring.get_password.call_count == 1
+
+        store_credentials(url, "user", "new")
+        mock_keyring.get_password.return_value = json.dumps({"u": "user", "t": "new"})
+        assert get_credentials(url) == ("user", "new")
+
+        delete_credentials(url)
+        calls = mock_keyring.get_password.call_count
+        assert get_credentials(url) is None
+        assert mock_keyring.get_password.call_count == calls
+
+    def test_clear_cache_rereads_keyring(self, mock_keyring):
+        url = "https://example.com/feed"
+        mock_keyring.get_password.return_value = json.dumps({"u": "user", "t": "tok"})
+        get_credentials(url)
+
+        clear_credential_cache()
+        get_credentials(url)
+
+        assert mock_keyring.get_password.call_count == 2
+
 
 class TestDeleteCredentials:
-    @patch("src.credential_store.keyring")
     def test_delete_existing_credentials(self, mock_keyring):
         delete_credentials("https://example.com/feed")
 
-        assert mock_keyring.delete_password.call_count == 2
+        assert mock_keyring.delete_password.call_count == 3
+        mock_keyring.delete_password.assert_any_call(
+            "jinkies:https://example.com/feed", "credentials",
+        )
         mock_keyring.delete_password.assert_any_call(
             "jinkies:https://example.com/feed", "username",
         )
@@ -83,12 +146,8 @@ class TestDeleteCredentials:
             "jinkies:https://example.com/feed", "token",
         )
 
-    @patch("src.credential_store.keyring")
     def test_delete_nonexistent_credentials(self, mock_keyring):
-        import keyring.errors
-
-        mock_keyring.delete_password.side_effect = keyring.errors.PasswordDeleteError
-        mock_keyring.errors = keyring.errors
+        mock_keyring.delete_password.side_effect = PasswordDeleteError
 
         # Should not raise
         delete_credentials("https://example.com/feed")
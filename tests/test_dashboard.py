@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QListWidgetItem, QMessageBox
 
 from src.dashboard import Dashboard
 from src.models import Feed, FeedEntry
@@ -56,7 +57,7 @@ class TestDashboard:
         ]
         dashboard.add_entries(entries)
         assert len(dashboard.entries) == 2
-        assert dashboard._entry_table.rowCount() == 2
+        assert dashboard._entry_table.model().rowCount() == 2
 
     def test_record_error(self, qtbot):
         dashboard = Dashboard()
@@ -256,6 +257,39 @@ class TestDashboard:
 
         assert blocker.args == [[0, 2]]
 
+    def test_remove_feeds_drops_rows_and_filter_entries(self, qtbot):
+        """remove_feeds removes only the given rows from the list and filter."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        feeds = [
+            Feed(url="https://a.com/feed", name="Feed A"),
+            Feed(url="https://b.com/feed", name="Feed B"),
+            Feed(url="https://c.com/feed", name="Feed C"),
+        ]
+        dashboard.update_feeds(feeds)
+        dashboard._filter_combo.setCurrentIndex(3)  # Feed C
+
+        dashboard.remove_feeds([0, 2])
+
+        assert dashboard._feed_list.count() == 1
+        assert dashboard._feed_list.item(0).text() == "Feed B"
+        combo = dashboard._filter_combo
+        assert [combo.itemText(i) for i in range(combo.count())] == ["All Feeds", "Feed B"]
+        assert combo.currentIndex() == 0
+        assert dashboard._feed_name_for("https://a.com/feed") == "https://a.com/feed"
+        assert dashboard._feed_name_for("https://b.com/feed") == "Feed B"
+
+    def test_feed_name_lookup_does_not_touch_list_items(self, qtbot):
+        """_feed_name_for reads the cached name instead of the list widget."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.update_feeds([Feed(url="https://a.com/feed", name="Feed A")])
+
+        with patch.object(QListWidgetItem, "text") as mock_text:
+            assert dashboard._feed_name_for("https://a.com/feed") == "Feed A"
+            assert dashboard._feed_name_for("https://x.com/feed") == "https://x.com/feed"
+        mock_text.assert_not_called()
+
     def test_remove_feed_signal_not_emitted_when_nothing_selected(self, qtbot):
         """remove_feed_requested must not be emitted when no row is selected."""
         dashboard = Dashboard()
@@ -288,12 +322,12 @@ class TestDashboard:
             seen=False,
         )
         dashboard.entries = [entry]
-
-        mock_index = MagicMock()
-        mock_index.row.return_value = 0
+        dashboard._refresh_table()
+        index = dashboard._entry_table.model().index(0, 0)
 
         with patch("PySide6.QtGui.QDesktopServices.openUrl"):
-            dashboard._on_entry_double_click(mock_index)
+            dashboard._on_entry_double_click(index)
+        dashboard.flush_entries_store()
 
         # The in-memory entry must be marked as seen.
         assert entry.seen is True
@@ -323,11 +357,10 @@ class TestDashboard:
             seen=False,
         )
         dashboard.entries = [entry]
+        dashboard._refresh_table()
+        index = dashboard._entry_table.model().index(0, 0)
 
-        mock_index = MagicMock()
-        mock_index.row.return_value = 0
-
-        dashboard._on_entry_double_click(mock_index)
+        dashboard._on_entry_double_click(index)
 
         # Entry with no link must NOT be marked as seen, store must be unchanged.
         assert entry.seen is False
@@ -403,11 +436,11 @@ class TestDashboard:
             entry_id="e1",
         )
         dashboard.add_entries([entry])
-        assert dashboard._entry_table.rowCount() == 1
+        assert dashboard._entry_table.model().rowCount() == 1
 
         # Adding the same entry again must not change anything.
         dashboard.add_entries([entry])
-        assert dashboard._entry_table.rowCount() == 1
+        assert dashboard._entry_table.model().rowCount() == 1
         assert len(dashboard.entries) == 1
 
     def test_insert_new_rows_prepends_newest_at_top(self, qtbot, tmp_path):
@@ -433,13 +466,32 @@ class TestDashboard:
         ]
         dashboard.add_entries(entries)
 
-        assert dashboard._entry_table.rowCount() == 2
+        assert dashboard._entry_table.model().rowCount() == 2
         titles = {
-            dashboard._entry_table.item(r, 0).text()
-            for r in range(dashboard._entry_table.rowCount())
+            dashboard._entry_table.model().index(r, 0).data()
+            for r in range(dashboard._entry_table.model().rowCount())
         }
         assert titles == {"Older Entry", "Newer Entry"}
 
+    def test_table_shows_newest_first_until_header_clicked(self, qtbot, tmp_path):
+        """Rows keep newest-first order rather than being sorted by title."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard._entries_store_location = tmp_path / "store.json"
+        dashboard.add_entries([
+            FeedEntry(
+                feed_url="https://a.com/feed",
+                title=title,
+                link=f"https://a.com/{title}",
+                published="2024-01-01",
+                entry_id=title,
+            )
+            for title in ("b", "a", "c")
+        ])
+
+        model = dashboard._entry_table.model()
+        assert [model.index(r, 0).data() for r in range(3)] == ["c", "a", "b"]
+
     def test_insert_new_rows_removes_evicted_rows_from_table(self, qtbot, tmp_path):
         """Evicted entries must be removed from the bottom of the visible table."""
         dashboard = Dashboard()
@@ -458,7 +510,7 @@ class TestDashboard:
             for i in range(2)
         ]
         dashboard.add_entries(initial)
-        assert dashboard._entry_table.rowCount() == 2
+        assert dashboard._entry_table.model().rowCount() == 2
 
         # Adding one new entry evicts one old entry; table must stay at 2 rows.
         new_entry = FeedEntry(
@@ -471,9 +523,9 @@ class TestDashboard:
         dashboard.add_entries([new_entry])
 
         assert len(dashboard.entries) == 2
-        assert dashboard._entry_table.rowCount() == 2
+        assert dashboard._entry_table.model().rowCount() == 2
         # Newest entry must be at the top.
-        assert dashboard._entry_table.item(0, 0).text() == "New Entry"
+        assert dashboard._entry_table.model().index(0, 0).data() == "New Entry"
 
     def test_insert_new_rows_respects_active_filter(self, qtbot, tmp_path):
         """Only entries matching the active filter should be inserted into the table."""
@@ -506,11 +558,268 @@ class TestDashboard:
         dashboard.add_entries(entries)
 
         # Only the Feed A entry should appear in the filtered table.
-        assert dashboard._entry_table.rowCount() == 1
-        assert dashboard._entry_table.item(0, 0).text() == "Feed A Entry"
+        assert dashboard._entry_table.model().rowCount() == 1
+        assert dashboard._entry_table.model().index(0, 0).data() == "Feed A Entry"
         # Both entries are still in memory.
         assert len(dashboard.entries) == 2
 
+    def test_feed_index_tracks_additions_and_evictions(self, qtbot):
+        """The per-feed index must match a scan of entries after capping."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.max_entries = 3
+        dashboard.update_feeds([
+            Feed(url="https://a.com/feed", name="Feed A"),
+            Feed(url="https://b.com/feed", name="Feed B"),
+        ])
+        dashboard.add_entries([
+            FeedEntry(
+                feed_url=f"https://{feed}.com/feed",
+                title=f"{feed}{i}",
+                link=f"https://{feed}.com/{i}",
+                published="2024-01-01",
+                entry_id=f"{feed}{i}",
+            )
+            for i, feed in enumerate("aabab")
+        ])
+
+        assert [e.entry_id for e in dashboard.entries] == ["b2", "a3", "b4"]
+        for name, url in (("Feed A", "https://a.com/feed"), ("Feed B", "https://b.com/feed")):
+            expected = [e for e in dashboard.entries if e.feed_url == url]
+            assert dashboard._entries_for_feed_name(name) == expected
+
+    def test_feed_filter_with_shared_or_removed_feed_names(self, qtbot):
+        """Feeds sharing a name, or no longer configured, still filter by scan."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.entries = [
+            FeedEntry(
+                feed_url=url,
+                title=entry_id,
+                link=f"https://example.com/{entry_id}",
+                published="2024-01-01",
+                entry_id=entry_id,
+            )
+            for url, entry_id in (
+                ("https://a.com/feed", "a1"),
+                ("https://b.com/feed", "b1"),
+                ("https://gone.com/feed", "g1"),
+                ("https://a.com/feed", "a2"),
+            )
+        ]
+        dashboard.update_feeds([
+            Feed(url="https://a.com/feed", name="Shared"),
+            Feed(url="https://b.com/feed", name="Shared"),
+        ])
+
+        shared = dashboard._entries_for_feed_name("Shared")
+        assert [e.entry_id for e in shared] == ["a1", "b1", "a2"]
+        removed = dashboard._entries_for_feed_name("https://gone.com/feed")
+        assert [e.entry_id for e in removed] == ["g1"]
+
+
+class TestEntriesStore:
+    """The entry store round-trips with and without the optional orjson."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+            yield
+        else:
+            with patch("src.config.orjson", None):
+                yield
+
+    def test_store_round_trip(self, backend, qtbot, monkeypatch, tmp_path):
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.entries = [
+            FeedEntry(
+                feed_url="https://a.com/feed",
+                title="Caf\u00e9 news",
+                link="https://a.com/1",
+                published="2024-01-01",
+                entry_id="e1",
+                seen=True,
+            )
+        ]
+        dashboard._save_entries_store()
+
+        data = json.loads((tmp_path / "store.json").read_bytes())
+        assert data["stats_date"] == dashboard._stats_date.isoformat()
+
+        reloaded = Dashboard()
+        qtbot.addWidget(reloaded)
+        assert reloaded.entries == dashboard.entries
+        assert reloaded._stats_date == dashboard._stats_date
+
+    @pytest.mark.parametrize("max_entries", [2, 20_000])
+    def test_load_applies_constructor_cap(self, qtbot, monkeypatch, tmp_path, max_entries):
+        """The cap passed at construction bounds, and only bounds, the load."""
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        stored = [self._entry(i).to_dict() for i in range(10_005)]
+        (tmp_path / "store.json").write_text(json.dumps({"entries": stored}))
+
+        dashboard = Dashboard(max_entries=max_entries)
+        qtbot.addWidget(dashboard)
+
+        expected = stored[-max_entries:]
+        assert [e.to_dict() for e in dashboard.entries] == expected
+
+    def test_load_skips_logged_entries_already_in_trimmed_snapshot(
+        self, qtbot, monkeypatch, tmp_path
+    ):
+        """Log entries that duplicate old, trimmed snapshot entries stay out."""
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        stored = [self._entry(i).to_dict() for i in range(3)]
+        (tmp_path / "store.json").write_text(json.dumps({"entries": stored}))
+        (tmp_path / "store.log").write_text(
+            json.dumps(self._entry(0).to_dict()) + "\n"
+            + json.dumps(self._entry(3).to_dict()) + "\n"
+        )
+
+        dashboard = Dashboard(max_entries=2)
+        qtbot.addWidget(dashboard)
+
+        assert [e.entry_id for e in dashboard.entries] == ["e2", "e3"]
+
+    def _entry(self, i: int) -> FeedEntry:
+        return FeedEntry(
+            feed_url="https://a.com/feed",
+            title=f"Entry {i}",
+            link=f"https://a.com/{i}",
+            published="2024-01-01",
+            entry_id=f"e{i}",
+        )
+
+    def test_add_entries_appends_to_log(self, backend, qtbot, monkeypatch, tmp_path):
+        """New entries go to the log; the snapshot is not rewritten."""
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.flush_entries_store()  # the first-run stats reset
+        snapshot = (tmp_path / "store.json").read_bytes()
+
+        dashboard.add_entries([self._entry(0), self._entry(1)])
+        dashboard.add_entries([self._entry(2)])
+        dashboard.flush_entries_store()
+
+        assert (tmp_path / "store.json").read_bytes() == snapshot
+        assert len((tmp_path / "store.log").read_bytes().splitlines()) == 3
+
+        reloaded = Dashboard()
+        qtbot.addWidget(reloaded)
+        assert [e.entry_id for e in reloaded.entries] == ["e0", "e1", "e2"]
+
+    def test_writes_are_coalesced(self, backend, qtbot, monkeypatch, tmp_path):
+        """A burst of changes reaches the disk once, after the save delay."""
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard._entries_store_location = tmp_path / "other.json"
+
+        with patch.object(
+            dashboard, "_save_entries_store", wraps=dashboard._save_entries_store
+        ) as mock_save:
+            dashboard.add_entries([self._entry(0)])
+            dashboard._do_mark_all_seen(None)
+            dashboard.add_entries([self._entry(1)])
+            dashboard._do_mark_all_seen(None)
+            assert not (tmp_path / "other.json").exists()
+            qtbot.waitUntil(lambda: (tmp_path / "other.json").exists())
+
+        mock_save.assert_called_once()
+        data = json.loads((tmp_path / "other.json").read_bytes())
+        assert [(e["entry_id"], e["seen"]) for e in data["entries"]] == [
+            ("e0", True),
+            ("e1", True),
+        ]
+
+    def test_close_flushes_pending_entries(self, backend, qtbot, monkeypatch, tmp_path):
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.flush_entries_store()  # the first-run stats reset
+        dashboard.add_entries([self._entry(0)])
+
+        dashboard.close()
+
+        assert len((tmp_path / "store.log").read_bytes().splitlines()) == 1
+
+    def test_snapshot_folds_in_and_removes_log(self, backend, qtbot, monkeypatch, tmp_path):
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.add_entries([self._entry(0)])
+
+        dashboard._save_entries_store()
+
+        assert not (tmp_path / "store.log").exists()
+        data = json.loads((tmp_path / "store.json").read_bytes())
+        assert [e["entry_id"] for e in data["entries"]] == ["e0"]
+
+    def test_failed_snapshot_keeps_store_and_log(self, backend, qtbot, monkeypatch, tmp_path):
+        """A snapshot that fails to write leaves the old store and the log intact."""
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard.flush_entries_store()  # the first-run stats reset
+        dashboard.add_entries([self._entry(0)])
+        dashboard.flush_entries_store()
+        snapshot = (tmp_path / "store.json").read_bytes()
+
+        with (
+            patch("src.config.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            dashboard._save_entries_store()
+
+        assert (tmp_path / "store.json").read_bytes() == snapshot
+        assert (tmp_path / "store.log").exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["store.json", "store.log"]
+
+    def test_large_log_is_compacted(self, backend, qtbot, monkeypatch, tmp_path):
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        monkeypatch.setattr("src.dashboard.ENTRIES_LOG_COMPACT_BYTES", 100)
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+
+        dashboard.add_entries([self._entry(0), self._entry(1)])
+        dashboard.flush_entries_store()
+
+        assert not (tmp_path / "store.log").exists()
+        data = json.loads((tmp_path / "store.json").read_bytes())
+        assert [e["entry_id"] for e in data["entries"]] == ["e0", "e1"]
+
+    def test_corrupted_store_still_loads_log(self, backend, qtbot, monkeypatch, tmp_path):
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        (tmp_path / "store.json").write_text('{"entries": [{"feed')
+        (tmp_path / "store.log").write_text(json.dumps(self._entry(0).to_dict()) + "\n")
+
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+
+        assert [e.entry_id for e in dashboard.entries] == ["e0"]
+
+    def test_load_skips_malformed_and_duplicate_log_lines(
+        self, backend, qtbot, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr("src.dashboard.get_config_dir", lambda: tmp_path)
+        (tmp_path / "store.json").write_text(
+            json.dumps({"entries": [self._entry(0).to_dict()]})
+        )
+        (tmp_path / "store.log").write_text(
+            json.dumps(self._entry(0).to_dict()) + "\n"
+            + json.dumps(self._entry(1).to_dict()) + "\n"
+            + '{"feed_url": "https://a.com/feed", "tit'
+        )
+
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+
+        assert [e.entry_id for e in dashboard.entries] == ["e0", "e1"]
+
 
 class TestMarkAsSeen:
     """Tests for the bulk mark-as-seen actions."""
@@ -589,6 +898,7 @@ class TestMarkAsSeen:
         dashboard.update_feeds(feeds)
 
         dashboard._do_mark_all_seen(None)
+        dashboard.flush_entries_store()
 
         with open(store_path) as f:
             data = json.load(f)
@@ -691,6 +1001,38 @@ class TestMarkAsSeen:
         seen_entries = [e for e in dashboard.entries if e.seen]
         assert len(seen_entries) == 1
 
+    def test_mark_selected_seen_follows_header_sort(self, qtbot, tmp_path):
+        """Selecting a row in a sorted view marks the entry displayed in that row."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard._entries_store_location = tmp_path / "store.json"
+        dashboard.entries = self._make_entries()
+        dashboard._refresh_table()
+
+        dashboard._entry_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        assert dashboard._entry_table.model().index(0, 0).data() == "Feed A Entry 1"
+        dashboard._entry_table.selectRow(0)
+        dashboard._mark_selected_seen()
+
+        assert [e.entry_id for e in dashboard.entries if e.seen] == ["a1"]
+
+    def test_mark_selected_seen_updates_status_without_reset(self, qtbot, tmp_path):
+        """Marking rows seen repaints Status in place and keeps the selection."""
+        dashboard = Dashboard()
+        qtbot.addWidget(dashboard)
+        dashboard._entries_store_location = tmp_path / "store.json"
+        dashboard.entries = self._make_entries()
+        dashboard._refresh_table()
+        resets = []
+        dashboard._entry_model.modelReset.connect(lambda: resets.append(True))
+
+        dashboard._entry_table.selectRow(0)
+        dashboard._mark_selected_seen()
+
+        assert resets == []
+        assert dashboard._entry_table.model().index(0, 3).data() == "Seen"
+        assert dashboard._entry_table.selectionModel().isRowSelected(0)
+
     def test_mark_selected_seen_noop_when_nothing_selected(self, qtbot, tmp_path):
         """_mark_selected_seen with no selection should not write to disk."""
         dashboard = Dashboard()
@@ -742,7 +1084,7 @@ class TestPagination:
         dashboard._refresh_table()
 
         assert dashboard._pagination_widget.isHidden()
-        assert dashboard._entry_table.rowCount() == 50
+        assert dashboard._entry_table.model().rowCount() == 50
 
     def test_pagination_shown_when_entries_exceed_page_size(self, qtbot, tmp_path):
         """Pagination controls should be visible when total entries > page_size."""
@@ -755,7 +1097,7 @@ class TestPagination:
         dashboard._refresh_table()
 
         assert not dashboard._pagination_widget.isHidden()
-        assert dashboard._entry_table.rowCount() == 10
+        assert dashboard._entry_table.model().rowCount() == 10
 
     def test_first_page_shows_correct_entries(self, qtbot, tmp_path):
         """First page should show the most recent entries (reversed order)."""
@@ -769,8 +1111,8 @@ class TestPagination:
         dashboard._refresh_table()
 
         # Page 0 of reversed [e11..e0] → titles {Entry 7..Entry 11}
-        assert dashboard._entry_table.rowCount() == 5
-        titles = {dashboard._entry_table.item(r, 0).text() for r in range(5)}
+        assert dashboard._entry_table.model().rowCount() == 5
+        titles = {dashboard._entry_table.model().index(r, 0).data() for r in range(5)}
         assert titles == {"Entry 7", "Entry 8", "Entry 9", "Entry 10", "Entry 11"}
 
     def test_next_page_shows_next_entries(self, qtbot, tmp_path):
@@ -787,9 +1129,9 @@ class TestPagination:
         dashboard._on_next_page()
 
         assert dashboard._current_page == 1
-        assert dashboard._entry_table.rowCount() == 5
+        assert dashboard._entry_table.model().rowCount() == 5
         # Page 1 of reversed [e11..e0] → offset 5..9 → {Entry 2..Entry 6}
-        titles = {dashboard._entry_table.item(r, 0).text() for r in range(5)}
+        titles = {dashboard._entry_table.model().index(r, 0).data() for r in range(5)}
         assert titles == {"Entry 2", "Entry 3", "Entry 4", "Entry 5", "Entry 6"}
 
     def test_prev_page_navigates_back(self, qtbot, tmp_path):
@@ -807,7 +1149,7 @@ class TestPagination:
 
         assert dashboard._current_page == 0
         # Page 0 of reversed [e11..e0] → titles {Entry 7..Entry 11}
-        titles = {dashboard._entry_table.item(r, 0).text() for r in range(5)}
+        titles = {dashboard._entry_table.model().index(r, 0).data() for r in range(5)}
         assert titles == {"Entry 7", "Entry 8", "Entry 9", "Entry 10", "Entry 11"}
 
     def test_prev_page_no_op_on_first_page(self, qtbot, tmp_path):
@@ -914,7 +1256,10 @@ class TestPagination:
         dashboard._on_next_page()
 
         # 12 entries, page_size=5: pages 0,1 have 5; page 2 has 2
-        assert dashboard._entry_table.rowCount() == 2
+        model = dashboard._entry_table.model()
+        assert model.rowCount() == 2
+        titles = [model.index(r, 0).data() for r in range(2)]
+        assert titles == ["Entry 1", "Entry 0"]
 
     def test_double_click_on_second_page_resolves_correct_entry(self, qtbot, tmp_path):
         """Double-clicking a row on page 2 should mark an entry from page 2 as seen."""
@@ -930,11 +1275,10 @@ class TestPagination:
         # Page 1 contains reversed_filtered[5..9] = e6, e5, e4, e3, e2
         page1_ids = {"e2", "e3", "e4", "e5", "e6"}
 
-        mock_index = MagicMock()
-        mock_index.row.return_value = 0
+        index = dashboard._entry_table.model().index(0, 0)
 
         with patch("PySide6.QtGui.QDesktopServices.openUrl"):
-            dashboard._on_entry_double_click(mock_index)
+            dashboard._on_entry_double_click(index)
 
         # Exactly one entry from page 1 should be marked as seen
         seen_entries = [e for e in dashboard.entries if e.seen]
@@ -1025,8 +1369,8 @@ class TestEntrySearch:
         dashboard._refresh_table()
 
         # Only "Python release notes" matches by title
-        assert dashboard._entry_table.rowCount() == 1
-        assert dashboard._entry_table.item(0, 0).text() == "Python release notes"
+        assert dashboard._entry_table.model().rowCount() == 1
+        assert dashboard._entry_table.model().index(0, 0).data() == "Python release notes"
 
     def test_search_is_case_insensitive(self, qtbot):
         """Search should be case-insensitive."""
@@ -1039,8 +1383,8 @@ class TestEntrySearch:
         dashboard._search_input.setText("RUST")
         dashboard._refresh_table()
 
-        assert dashboard._entry_table.rowCount() == 1
-        assert dashboard._entry_table.item(0, 0).text() == "Rust 1.75 released"
+        assert dashboard._entry_table.model().rowCount() == 1
+        assert dashboard._entry_table.model().index(0, 0).data() == "Rust 1.75 released"
 
     def test_search_empty_shows_all_entries(self, qtbot):
         """Clearing the search box shows all entries."""
@@ -1055,10 +1399,10 @@ class TestEntrySearch:
 
         dashboard._search_input.setText("rust")
         dashboard._refresh_table()
-        assert dashboard._entry_table.rowCount() == 1
+        assert dashboard._entry_table.model().rowCount() == 1
 
         dashboard._search_input.clear()
-        assert dashboard._entry_table.rowCount() == 3
+        assert dashboard._entry_table.model().rowCount() == 3
 
     def test_search_content_off_does_not_match_summary_only(self, qtbot):
         """Without 'Include content', summary-only matches are excluded."""
@@ -1076,7 +1420,7 @@ class TestEntrySearch:
         dashboard._search_input.setText("borrow")
         dashboard._refresh_table()
 
-        assert dashboard._entry_table.rowCount() == 0
+        assert dashboard._entry_table.model().rowCount() == 0
 
     def test_search_content_on_matches_summary(self, qtbot):
         """With 'Include content' checked, summary text is also searched."""
@@ -1094,8 +1438,8 @@ class TestEntrySearch:
         dashboard._search_input.setText("borrow")
         dashboard._refresh_table()
 
-        assert dashboard._entry_table.rowCount() == 1
-        assert dashboard._entry_table.item(0, 0).text() == "Rust 1.75 released"
+        assert dashboard._entry_table.model().rowCount() == 1
+        assert dashboard._entry_table.model().index(0, 0).data() == "Rust 1.75 released"
 
     def test_search_content_on_matches_title_and_summary(self, qtbot):
         """With 'Include content' checked, entries matching title OR summary are shown."""
@@ -1113,7 +1457,7 @@ class TestEntrySearch:
         dashboard._search_input.setText("python")
         dashboard._refresh_table()
 
-        assert dashboard._entry_table.rowCount() == 2
+        assert dashboard._entry_table.model().rowCount() == 2
 
     def test_feed_filter_change_resets_search_text(self, qtbot):
         """Changing the feed filter combo should clear the search input."""
@@ -1151,8 +1495,8 @@ class TestEntrySearch:
         dashboard._refresh_table()
 
         # Feed A has 2 entries; only "Python release notes" matches "python" in title
-        assert dashboard._entry_table.rowCount() == 1
-        assert dashboard._entry_table.item(0, 0).text() == "Python release notes"
+        assert dashboard._entry_table.model().rowCount() == 1
+        assert dashboard._entry_table.model().index(0, 0).data() == "Python release notes"
 
     def test_get_display_entries_respects_search(self, qtbot):
         """_get_display_entries returns only entries matching the active search."""
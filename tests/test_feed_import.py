@@ -86,6 +86,21 @@ class TestImportOpml:
         assert "Feed B" in names
         assert "Feed C" in names
 
+    def test_preserves_document_order(self, tmp_path):
+        """Feeds come back in document order, categories before their children."""
+        opml_file = tmp_path / "nested.opml"
+        opml_file.write_text("""\
+<?xml version="1.0"?>
+<opml version="2.0"><body>
+  <outline text="Parent" xmlUrl="https://parent.com/feed">
+    <outline text="Child" xmlUrl="https://child.com/feed"/>
+  </outline>
+  <outline text="Sibling" xmlUrl="https://sibling.com/feed"/>
+</body></opml>
+""")
+        feeds = import_opml(opml_file)
+        assert [f.name for f in feeds] == ["Parent", "Child", "Sibling"]
+
     def test_invalid_xml_raises(self, tmp_path):
         bad_file = tmp_path / "bad.opml"
         bad_file.write_text("this is not xml")
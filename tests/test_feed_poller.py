@@ -6,11 +6,14 @@ import base64
 import hashlib
 import urllib.error
 import urllib.request
+import warnings
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import feedparser
 import pytest
 
-from src.feed_poller import FeedPoller
+from src.feed_poller import FeedPoller, _parse_atom
 from src.models import Feed
 
 
@@ -76,6 +79,41 @@ class TestFeedPoller:
         assert elapsed < 1.0, f"Sleep took too long to interrupt ({elapsed:.2f}s)"
         assert poller.poll_interval == 30
 
+    def test_run_polls_feeds_concurrently(self, qtbot):
+        """Each feed is fetched on its own worker, so one slow feed does not block another."""
+        import threading
+
+        feeds = [Feed(url=f"https://{name}.example.com/feed", name=name) for name in "ab"]
+        poller = FeedPoller(feeds=feeds, poll_interval=60)
+        # Both polls must be in flight at once for the barrier to open.
+        barrier = threading.Barrier(2, timeout=5)
+        polled: list[str] = []
+
+        def fake_poll(feed: Feed) -> None:
+            barrier.wait()
+            polled.append(feed.url)
+
+        poller._poll_feed = fake_poll  # type: ignore[method-assign]
+        with qtbot.waitSignal(poller.poll_complete, timeout=5000):
+            poller.start()
+        poller.requestInterruption()
+        assert poller.wait(5000)
+
+        assert sorted(polled) == sorted(f.url for f in feeds)
+
+    def test_request_interruption_wakes_sleeping_poller(self, qtbot):
+        """A poller sleeping between cycles stops as soon as interruption is requested."""
+        import time
+
+        poller = FeedPoller(feeds=[], poll_interval=60)
+        with qtbot.waitSignal(poller.poll_complete, timeout=5000):
+            poller.start()
+
+        start = time.monotonic()
+        poller.requestInterruption()
+        assert poller.wait(1000)
+        assert time.monotonic() - start < 0.5
+
     @patch("src.feed_poller.get_credentials", return_value=None)
     @patch("src.feed_poller.feedparser.parse")
     def test_poll_feed_emits_new_entries(
@@ -135,6 +173,43 @@ class TestFeedPoller:
         assert len(entries) == 1
         assert entries[0].entry_id == "entry-2"
 
+    @patch("src.feed_poller.get_credentials", return_value=None)
+    @patch("src.feed_poller.feedparser.parse")
+    def test_poll_feed_reports_repeated_entry_once(
+        self, mock_parse, _mock_creds, sample_feed, mock_feedparser_result, qtbot,
+    ):
+        """An entry listed twice in one response is emitted once, in feed order."""
+        first, second = mock_feedparser_result.entries
+        mock_feedparser_result.entries = [first, second, first]
+        mock_parse.return_value = mock_feedparser_result
+        poller = FeedPoller(feeds=[sample_feed])
+
+        entries = []
+        poller.new_entries_found.connect(entries.extend)
+        poller._poll_feed(sample_feed)
+
+        assert [e.entry_id for e in entries] == ["entry-1", "entry-2"]
+        assert poller.seen_ids == {"entry-1", "entry-2"}
+
+    @patch("src.feed_poller.get_credentials", return_value=None)
+    @patch("src.feed_poller.feedparser.parse")
+    def test_poll_feed_emits_all_new_entries_in_one_signal(
+        self, mock_parse, _mock_creds, sample_feed, mock_feedparser_result, qtbot,
+    ):
+        mock_feedparser_result.entries = [
+            feedparser.FeedParserDict(id=f"e{i}", title=f"T{i}", link=f"https://x/{i}")
+            for i in range(500)
+        ]
+        mock_parse.return_value = mock_feedparser_result
+        poller = FeedPoller(feeds=[sample_feed])
+
+        batches = []
+        poller.new_entries_found.connect(batches.append)
+        poller._poll_feed(sample_feed)
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 500
+
     @patch("src.feed_poller.get_credentials", return_value=None)
     @patch("src.feed_poller.feedparser.parse")
     def test_poll_feed_error(self, mock_parse, _mock_creds, sample_feed, qtbot):
@@ -163,10 +238,9 @@ class TestFeedPoller:
     @patch("src.feed_poller.get_credentials", return_value=None)
     @patch("src.feed_poller.feedparser.parse")
     def test_poll_feed_bozo_error(self, mock_parse, _mock_creds, sample_feed, qtbot):
-        result = MagicMock()
-        result.bozo = True
-        result.entries = []
-        result.bozo_exception = ValueError("Bad XML")
+        result = SimpleNamespace(
+            bozo=True, entries=[], bozo_exception=ValueError("Bad XML"),
+        )
         mock_parse.return_value = result
 
         poller = FeedPoller(feeds=[sample_feed])
@@ -267,6 +341,29 @@ class TestFeedPollerAuth:
         mock_parse.assert_called_once_with(b"<feed></feed>")
         assert len(entries) == 2
 
+    @patch("src.feed_poller.urllib.request.urlopen")
+    @patch("src.feed_poller.get_credentials", return_value=("user", "token123"))
+    @patch("src.feed_poller.feedparser.parse")
+    def test_credential_changes_apply_to_next_poll(
+        self, mock_parse, mock_creds, mock_urlopen, mock_feedparser_result, qtbot,
+    ):
+        """Credentials are read on every poll, so edits apply without update_feeds."""
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = b"<feed/>"
+        mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+        mock_parse.return_value = mock_feedparser_result
+        feed = Feed(url="https://secure.example.com/feed", name="Secure")
+        poller = FeedPoller(feeds=[feed])
+
+        poller._poll_feed(feed)
+        mock_creds.return_value = None
+        poller._poll_feed(feed)
+
+        assert mock_creds.call_count == 2
+        mock_urlopen.assert_called_once()
+
     @patch("src.feed_poller.get_credentials", return_value=None)
     @patch("src.feed_poller.feedparser.parse")
     def test_no_auth_http_url_allowed(
@@ -430,6 +527,127 @@ class TestFeedPollerAuth:
         assert "Connection refused" in errors[0][1]
 
 
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate", "raw-deflate"])
+    @patch("src.feed_poller.urllib.request.urlopen")
+    @patch("src.feed_poller.get_credentials", return_value=("user", "token123"))
+    @patch("src.feed_poller.feedparser.parse")
+    def test_auth_fetch_decodes_compressed_body(
+        self, mock_parse, _mock_creds, mock_urlopen, encoding, mock_feedparser_result, qtbot,
+    ):
+        """Compressed responses are requested and decoded before parsing."""
+        import gzip
+        import zlib
+
+        raw_content = b"<rss><channel><item><title>Hello</title></item></channel></rss>"
+        if encoding == "gzip":
+            body = gzip.compress(raw_content)
+        elif encoding == "deflate":
+            body = zlib.compress(raw_content)
+        else:
+            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            body = compressor.compress(raw_content) + compressor.flush()
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = body
+        mock_resp.headers = {"Content-Encoding": encoding.removeprefix("raw-")}
+        mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+        mock_parse.return_value = mock_feedparser_result
+
+        feed = Feed(url="https://secure.example.com/feed", name="Secure")
+        poller = FeedPoller(feeds=[feed])
+        poller._poll_feed(feed)
+
+        req = mock_urlopen.call_args[0][0]
+        assert req.get_header("Accept-encoding") == "gzip, deflate"
+        mock_parse.assert_called_once_with(raw_content)
+
+    @patch("src.feed_poller.urllib.request.urlopen")
+    @patch("src.feed_poller.get_credentials", return_value=("user", "token123"))
+    def test_auth_fetch_corrupt_gzip_emits_feed_error(self, _mock_creds, mock_urlopen, qtbot):
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = b"not gzip"
+        mock_resp.headers = {"Content-Encoding": "gzip"}
+        mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+
+        feed = Feed(url="https://secure.example.com/feed", name="Secure")
+        poller = FeedPoller(feeds=[feed])
+        errors = []
+        poller.feed_error.connect(lambda url, msg: errors.append(msg))
+        poller._poll_feed(feed)
+
+        assert len(errors) == 1
+        assert "gzip" in errors[0]
+
+
+class TestParseAtom:
+    """_parse_atom matches feedparser on plain Atom and defers on anything else."""
+
+    ATOM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>All builds</title>
+<entry><title> job #12 (stable) &amp; more </title>
+<link rel="alternate" type="text/html" href="https://ci/job/12/"/>
+<id>tag:hudson,2008:job:12</id>
+<published>2024-01-01T00:00:00Z</published><updated>2024-01-02T00:00:00Z</updated></entry>
+<entry><title>x</title><link rel="self" href="https://ci/self"/><link href="https://ci/2"/>
+<id> id2 </id><updated>2024-01-02T00:00:00Z</updated><content>body &lt;b&gt;</content></entry>
+<entry><summary>sum</summary><content>c</content></entry>
+</feed>"""
+
+    FIELDS = ("id", "title", "link", "published", "updated", "summary")
+
+    def test_matches_feedparser(self):
+        fast = _parse_atom(self.ATOM)
+        slow = feedparser.parse(self.ATOM)
+        assert fast is not None
+        assert not fast.bozo
+        assert [{k: e.get(k) for k in self.FIELDS} for e in fast.entries] == [
+            {k: e.get(k) for k in self.FIELDS} for e in slow.entries
+        ]
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"<rss><channel><item><title>x</title></item></channel></rss>",
+            b"<feed><entry><title>no namespace</title></entry></feed>",
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            b'<title type="html">&lt;b&gt;x&lt;/b&gt;</title></entry></feed>',
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            b'<link href="/job/1/"/></entry></feed>',
+            b'<!DOCTYPE feed [<!ENTITY e "x">]>'
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><title>&e;</title></feed>',
+            b"<feed",
+        ],
+        ids=["rss", "no-namespace", "html-title", "relative-link", "dtd", "malformed"],
+    )
+    def test_defers_to_feedparser(self, content):
+        assert _parse_atom(content) is None
+
+    @patch("src.feed_poller.urllib.request.urlopen")
+    @patch("src.feed_poller.get_credentials", return_value=("user", "token123"))
+    @patch("src.feed_poller.feedparser.parse")
+    def test_auth_fetch_uses_fast_path(self, mock_parse, _mock_creds, mock_urlopen, qtbot):
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = self.ATOM
+        mock_resp.__enter__ = MagicMock(return_value=mock_resp)
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_resp.headers = {}
+        mock_urlopen.return_value = mock_resp
+
+        feed = Feed(url="https://ci.example.com/rssAll", name="CI")
+        poller = FeedPoller(feeds=[feed])
+        with qtbot.waitSignal(poller.new_entries_found) as blocker:
+            poller._poll_feed(feed)
+
+        mock_parse.assert_not_called()
+        entries = blocker.args[0]
+        assert [e.title for e in entries] == ["job #12 (stable) & more", "x", "Untitled"]
+        assert entries[0].link == "https://ci/job/12/"
+        assert entries[1].summary == "body <b>"
+
+
 class TestFeedPollerETag:
     """Tests for ETag/Last-Modified conditional-GET support."""
 
@@ -497,7 +715,7 @@ class TestFeedPollerETag:
         self, mock_parse, _mock_creds, mock_feedparser_result, qtbot,
     ):
         """If the server does not return an ETag the existing value is kept."""
-        del mock_feedparser_result.etag  # ensure attribute is absent
+        assert not hasattr(mock_feedparser_result, "etag")
         mock_parse.return_value = mock_feedparser_result
         feed = Feed(url="https://example.com/feed.atom", name="Feed", etag='"kept"')
         poller = FeedPoller(feeds=[feed])
@@ -624,11 +842,9 @@ class TestFeedPollerETag:
         assert len(errors) == 1
 
 
-def _make_entry(data: dict) -> MagicMock:
+def _make_entry(data: dict) -> SimpleNamespace:
     """Helper: create a mock feedparser entry whose .get() mirrors *data*."""
-    entry = MagicMock()
-    entry.get = lambda key, default="": data.get(key, default)
-    return entry
+    return SimpleNamespace(get=lambda key, default="": data.get(key, default))
 
 
 class TestGetEntryId:
@@ -656,6 +872,14 @@ class TestGetEntryId:
         expected = hashlib.sha256(b"T||2024-06-01").hexdigest()
         assert self.poller._get_entry_id(entry) == expected
 
+    def test_published_entry_does_not_fall_back_to_updated(self):
+        """feedparser warns when "updated" is answered from "published"."""
+        entry = feedparser.FeedParserDict(title="T", published="2024-01-01")
+        expected = hashlib.sha256(b"T||2024-01-01").hexdigest()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert self.poller._get_entry_id(entry) == expected
+
     def test_hash_fallback_is_stable(self):
         """Same content must always produce the same ID."""
         entry1 = _make_entry({"title": "A", "summary": "B", "published": "2024-01-01"})
@@ -687,9 +911,7 @@ class TestGetEntryId:
         entry1 = _make_entry({"title": "Alpha", "summary": "First", "published": "2024-01-01"})
         entry2 = _make_entry({"title": "Beta", "summary": "Second", "published": "2024-01-02"})
 
-        result = MagicMock()
-        result.bozo = False
-        result.entries = [entry1, entry2]
+        result = SimpleNamespace(bozo=False, entries=[entry1, entry2])
         mock_parse.return_value = result
 
         poller = FeedPoller(feeds=[sample_feed])
@@ -708,9 +930,7 @@ class TestGetEntryId:
         """An entry seen on the first poll must not re-appear on the second poll."""
         entry = _make_entry({"title": "Stable", "summary": "Content", "published": "2024-01-01"})
 
-        result = MagicMock()
-        result.bozo = False
-        result.entries = [entry]
+        result = SimpleNamespace(bozo=False, entries=[entry])
         mock_parse.return_value = result
 
         poller = FeedPoller(feeds=[sample_feed])
@@ -885,10 +1105,9 @@ class TestFeedPollerBackoff:
         self, mock_parse, _mock_creds, sample_feed, qtbot,
     ):
         """A bozo parse error with no entries should also trigger backoff."""
-        result = MagicMock()
-        result.bozo = True
-        result.entries = []
-        result.bozo_exception = ValueError("Bad XML")
+        result = SimpleNamespace(
+            bozo=True, entries=[], bozo_exception=ValueError("Bad XML"),
+        )
         mock_parse.return_value = result
 
         poller = FeedPoller(feeds=[sample_feed])
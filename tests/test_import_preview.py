@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+from PySide6.QtCore import Qt
+
 from src.models import Feed
 from src.settings_dialog import ImportPreviewDialog
 
@@ -28,11 +30,9 @@ class TestImportPreviewDialog:
         qtbot.addWidget(dialog)
 
         # Row 0 (duplicate) should be unchecked
-        cb0 = dialog._table.cellWidget(0, 0)
-        assert not cb0.isChecked()
+        assert not dialog._is_checked(0)
         # Row 1 (new) should be checked
-        cb1 = dialog._table.cellWidget(1, 0)
-        assert cb1.isChecked()
+        assert dialog._is_checked(1)
 
     def test_accept_collects_checked_feeds(self, qtbot):
         feeds = [
@@ -43,7 +43,7 @@ class TestImportPreviewDialog:
         qtbot.addWidget(dialog)
 
         # Uncheck the first feed
-        dialog._table.cellWidget(0, 0).setChecked(False)
+        dialog._table.item(0, 0).setCheckState(Qt.CheckState.Unchecked)
         dialog._accept_import()
 
         result = dialog.get_feeds()
@@ -130,12 +130,21 @@ class TestImportPreviewDialog:
         qtbot.addWidget(dialog)
 
         # Both should start unchecked (duplicates)
-        assert not dialog._table.cellWidget(0, 0).isChecked()
-        assert not dialog._table.cellWidget(1, 0).isChecked()
+        assert not dialog._is_checked(0)
+        assert not dialog._is_checked(1)
 
         dialog._set_all_checked(True)
-        assert dialog._table.cellWidget(0, 0).isChecked()
-        assert dialog._table.cellWidget(1, 0).isChecked()
+        assert dialog._is_checked(0)
+        assert dialog._is_checked(1)
+
+    def test_import_column_has_no_cell_widgets(self, qtbot):
+        feeds = [Feed(url="https://a.com/feed", name="A")]
+        dialog = ImportPreviewDialog(feeds)
+        qtbot.addWidget(dialog)
+
+        assert dialog._table.cellWidget(0, 0) is None
+        assert dialog._table.item(0, 0).flags() & Qt.ItemFlag.ItemIsUserCheckable
+        assert dialog._table.updatesEnabled()
 
     def test_select_none(self, qtbot):
         feeds = [
@@ -0,0 +1,25 @@
+"""Tests for the main.py launcher's command-line fast paths."""
+
+from __future__ import annotations
+
+import sys
+
+import main
+import src
+
+
+class TestInfoFlags:
+    def test_version_prints_without_importing_app(self, monkeypatch, capsys):
+        """--version should print the version without loading src.app."""
+        monkeypatch.setattr(sys, "argv", ["main.py", "--version"])
+        monkeypatch.delitem(sys.modules, "src.app", raising=False)
+        assert main.main() == 0
+        assert capsys.readouterr().out.strip() == f"Jinkies {src.__version__}"
+        assert "src.app" not in sys.modules
+
+    def test_help_prints_usage(self, monkeypatch, capsys):
+        """--help and -h should print usage and exit cleanly."""
+        for flag in ("--help", "-h"):
+            monkeypatch.setattr(sys, "argv", ["main.py", flag])
+            assert main.main() == 0
+            assert capsys.readouterr().out.startswith("usage: main.py")
@@ -8,6 +8,9 @@ from src.models import AppConfig, Feed, FeedEntry
 
 
 class TestFeed:
+    def test_uses_slots(self, sample_feed):
+        assert not hasattr(sample_feed, "__dict__")
+
     def test_to_dict(self, sample_feed):
         d = sample_feed.to_dict()
         assert d["url"] == "https://example.com/feed.atom"
@@ -97,6 +100,15 @@ class TestFeed:
         assert feed.auth_user == "admin"
         assert feed.auth_token == "secret"
 
+    def test_from_dict_maps_every_field(self):
+        """Positional construction must keep each value in its own field."""
+        feed = Feed(
+            url="u", name="n", enabled=False, sound_file="s", last_poll_time="t",
+            auth_user="a", auth_token="k", etag="e", modified="m",
+        )
+        data = {**feed.to_dict(), "auth_user": "a", "auth_token": "k"}
+        assert Feed.from_dict(data) == feed
+
     def test_roundtrip(self, sample_feed):
         restored = Feed.from_dict(sample_feed.to_dict())
         assert restored.url == sample_feed.url
@@ -105,6 +117,10 @@ class TestFeed:
 
 
 class TestFeedEntry:
+    def test_uses_slots(self, sample_entry):
+        """Entries carry no per-instance __dict__; the dashboard keeps thousands."""
+        assert not hasattr(sample_entry, "__dict__")
+
     def test_to_dict(self, sample_entry):
         d = sample_entry.to_dict()
         assert d["entry_id"] == "entry-1"
@@ -129,8 +145,43 @@ class TestFeedEntry:
         assert restored.entry_id == sample_entry.entry_id
         assert restored.title == sample_entry.title
 
+    def test_from_dict_maps_every_field(self):
+        """Positional construction must keep each value in its own field."""
+        entry = FeedEntry(
+            feed_url="f", title="t", link="l", published="p",
+            entry_id="i", seen=True, summary="s",
+        )
+        assert FeedEntry.from_dict(entry.to_dict()) == entry
+
+    def test_from_dicts_matches_from_dict(self):
+        dicts = [
+            FeedEntry("f", "t", "l", "p", "i", True, "s").to_dict(),
+            {"feed_url": "f2", "title": "t2", "link": "l2", "entry_id": "i2"},
+        ]
+        assert FeedEntry.from_dicts(dicts) == [FeedEntry.from_dict(d) for d in dicts]
+
+    def test_loaded_entries_share_feed_url(self):
+        dicts = [
+            {"feed_url": "".join(["https://a.com/", "feed"]), "title": "t",
+             "link": "l", "entry_id": str(i)}
+            for i in range(2)
+        ]
+        assert dicts[0]["feed_url"] is not dicts[1]["feed_url"]
+        first, second = FeedEntry.from_dicts(dicts)
+        assert first.feed_url is second.feed_url
+        assert FeedEntry.from_dict(dicts[0]).feed_url is first.feed_url
+
+    def test_from_dict_optional_defaults(self):
+        entry = FeedEntry.from_dict(
+            {"feed_url": "f", "title": "t", "link": "l", "entry_id": "i"}
+        )
+        assert (entry.published, entry.seen, entry.summary) == ("", False, "")
+
 
 class TestAppConfig:
+    def test_uses_slots(self):
+        assert not hasattr(AppConfig(), "__dict__")
+
     def test_defaults(self):
         config = AppConfig()
         assert config.poll_interval_secs == 60
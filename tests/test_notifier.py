@@ -55,6 +55,19 @@ class TestNotificationDialog:
         # Second dialog should be stacked higher (smaller y) than the first
         assert dlg2.pos().y() < dlg1.pos().y()
 
+    def test_new_dialog_fills_gap_left_by_dismissed_one(self, qtbot):
+        dialogs = [NotificationDialog(f"T{i}", "B", timeout_ms=60000) for i in range(3)]
+        for dlg in dialogs:
+            qtbot.addWidget(dlg)
+        middle_y = dialogs[1].pos().y()
+        dialogs[1]._dismiss()
+
+        replacement = NotificationDialog("T3", "B", timeout_ms=60000)
+        qtbot.addWidget(replacement)
+
+        assert replacement._slot == 1
+        assert replacement.pos().y() == middle_y
+
     def test_fade_in_shows_widget(self, qtbot):
         dlg = NotificationDialog("Title", "Body", timeout_ms=60000)
         qtbot.addWidget(dlg)
@@ -76,6 +89,13 @@ class TestNotificationDialog:
         assert dlg._anim.endValue() == 0.0
         assert dlg._anim.duration() == 300
 
+    def test_fade_out_reuses_fade_in_animation(self, qtbot):
+        dlg = NotificationDialog("Title", "Body", timeout_ms=60000)
+        qtbot.addWidget(dlg)
+        fade_in = dlg._anim
+        dlg._fade_out()
+        assert dlg._anim is fade_in
+
     def test_fade_out_connects_finished_to_dismiss(self, qtbot):
         dlg = NotificationDialog("Title", "Body", timeout_ms=60000)
         qtbot.addWidget(dlg)
@@ -87,6 +107,24 @@ class TestNotificationDialog:
         dlg._anim.finished.emit()
         assert called
 
+    def test_fade_in_finishing_does_not_dismiss(self, qtbot):
+        dlg = NotificationDialog("Title", "Body", timeout_ms=60000)
+        qtbot.addWidget(dlg)
+        called = []
+        dlg._dismiss = lambda: called.append(True)
+        dlg._anim.finished.emit()
+        assert not called
+
+    def test_repeated_fade_out_dismisses_once(self, qtbot):
+        dlg = NotificationDialog("Title", "Body", timeout_ms=60000)
+        qtbot.addWidget(dlg)
+        called = []
+        dlg._dismiss = lambda: called.append(True)
+        dlg._fade_out()
+        dlg._fade_out()
+        dlg._anim.finished.emit()
+        assert called == [True]
+
     def test_dismiss_removes_from_active_notifications(self, qtbot):
         dlg = NotificationDialog("Title", "Body", timeout_ms=60000)
         qtbot.addWidget(dlg)
@@ -154,6 +192,18 @@ class TestNotifier:
         mock_dialog_cls.assert_called_once_with("Alert", "Something happened")
 
 
+    def test_set_style_switches_in_place(self, qtbot):
+        """set_style changes the notification style without a new Notifier."""
+        with patch("src.notifier.sys") as mock_sys:
+            mock_sys.platform = "linux"
+            notifier = Notifier(tray_icon=MagicMock(), style="native")
+            assert notifier._use_custom is False
+            notifier.set_style("custom")
+            assert notifier._use_custom is True
+            notifier.set_style("native")
+            assert notifier._use_custom is False
+
+
 class TestActiveNotificationsRegistry:
     """Tests that _active_notifications is a proper module-level singleton."""
 
@@ -185,6 +235,16 @@ class TestActiveNotificationsRegistry:
         dlg._dismiss()
         assert dlg not in notifier_module._active_notifications
 
+    def test_closed_dialog_pruned_by_next_notification(self, qtbot):
+        """A dialog closed without _dismiss is dropped when another is shown."""
+        stale = NotificationDialog("T", "B", timeout_ms=60_000)
+        qtbot.addWidget(stale)
+        stale._dismiss_timer.stop()
+        stale.close()
+        dlg = NotificationDialog("T", "B", timeout_ms=60_000)
+        qtbot.addWidget(dlg)
+        assert notifier_module._active_notifications == [dlg]
+
     def test_registry_isolated_between_contexts(self, qtbot):
         """Registry must start empty (setup_method cleared it)."""
         assert notifier_module._active_notifications == []
@@ -173,6 +173,20 @@ class TestSettingsDialogRemoveFeed:
         assert title_arg == "Remove Feeds"
         assert "2" in msg_arg
 
+    def test_remove_then_save_writes_remaining_feeds(self, qtbot):
+        """Saving after a removal writes back exactly the feeds still listed."""
+        dialog, feeds = self._make_dialog_multi(qtbot)
+        dialog._feed_list.item(1).setSelected(True)
+
+        with patch("src.settings_dialog.QMessageBox.question",
+                   return_value=QMessageBox.StandardButton.Yes), \
+             patch("src.settings_dialog.delete_credentials"), \
+             patch.object(dialog, "accept"):
+            dialog._remove_feed()
+            dialog._save_and_accept()
+
+        assert dialog.config.feeds == [feeds[0], feeds[2]]
+
     def test_remove_multiple_feeds_cancelled(self, qtbot):
         """Cancelling bulk removal keeps all feeds in the list."""
         dialog, feeds = self._make_dialog_multi(qtbot)
@@ -235,6 +249,21 @@ class TestSettingsDialogLoadValues:
         assert "Test Feed" in item_text
         assert "https://example.com/feed.atom" in item_text
 
+    def test_load_values_keeps_order_and_reenables_updates(self, qtbot):
+        """Bulk population keeps feed order and leaves repaints enabled."""
+        from PySide6.QtCore import Qt as _Qt
+        feeds = [Feed(url=f"https://example.com/{i}", name=f"Feed {i}") for i in range(50)]
+        config = AppConfig(poll_interval_secs=60, feeds=feeds, sound_map={})
+        dialog = SettingsDialog(config)
+        qtbot.addWidget(dialog)
+
+        assert dialog._feed_list.updatesEnabled()
+        stored = [
+            dialog._feed_list.item(i).data(_Qt.ItemDataRole.UserRole)
+            for i in range(dialog._feed_list.count())
+        ]
+        assert stored == feeds
+
 
 class TestSettingsDialogBrowseSound:
     """Tests for SettingsDialog._browse_sound file selection."""
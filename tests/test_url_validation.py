@@ -53,6 +53,13 @@ class TestValidateFeedUrl:
         assert error is not None
         assert "hostname" in error.lower()
 
+    def test_repeat_validation_is_cached(self):
+        url = "https://cached.example.com/feed"
+        validate_feed_url(url)
+        with patch("src.url_validation.urlsplit") as mock_split:
+            assert validate_feed_url(url) is None
+        mock_split.assert_not_called()
+
 
 class TestCheckFeedConnectivity:
     """Tests for check_feed_connectivity."""